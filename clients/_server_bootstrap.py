@@ -0,0 +1,27 @@
+"""
+Server Bootstrap
+Makes the server package importable for the test clients and re-exports
+the launcher components they use
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_PATH = os.path.join(PROJECT_ROOT, 'server')
+WHITELIST_PATH = os.path.join(SERVER_PATH, 'process_whitelist.json')
+
+if SERVER_PATH not in sys.path:
+    sys.path.insert(0, SERVER_PATH)
+
+from config.whitelist import ProcessWhitelist, load_shared_whitelist
+from process.launcher import ApplicationLauncher
+
+__all__ = [
+    'PROJECT_ROOT',
+    'SERVER_PATH',
+    'WHITELIST_PATH',
+    'ProcessWhitelist',
+    'load_shared_whitelist',
+    'ApplicationLauncher'
+]
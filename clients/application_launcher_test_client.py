@@ -7,39 +7,33 @@ Tests the new application launcher functionality
 import logging
 import time
 import asyncio
-import sys
-import os
+import psutil
+from itertools import groupby
+from operator import itemgetter
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+try:
+    from ._server_bootstrap import ApplicationLauncher, load_shared_whitelist, WHITELIST_PATH
+except ImportError:
+    # Running as a script from the clients directory
+    from _server_bootstrap import ApplicationLauncher, load_shared_whitelist, WHITELIST_PATH
+
+# Shared status prefixes for dynamic log messages
+_OK = "✅ "
+_ERR = "❌ "
+
+FOUND_STATUS = "✅ Found"
+NOT_FOUND_STATUS = "⚠️ Not found"
+
 class ApplicationLauncherTestClient:
     """Test client for application launcher functionality"""
     
     def __init__(self):
-        # Add server path for imports
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        server_path = os.path.join(project_root, 'server')
-        sys.path.insert(0, server_path)
+        self.whitelist = load_shared_whitelist(WHITELIST_PATH)
         
-        try:
-            # Import MCP components for direct testing
-            from config.whitelist import ProcessWhitelist
-            from process.launcher import ApplicationLauncher
-            
-            self.whitelist = ProcessWhitelist()
-            self.whitelist.load_whitelist(os.path.join(server_path, 'process_whitelist.json'))
-            
-            self.launcher = ApplicationLauncher(self.whitelist)
-            logger.info("✅ Application launcher test client initialized")
-            
-        except ImportError as e:
-            logger.error(f"❌ Failed to import components: {e}")
-            raise
+        self.launcher = ApplicationLauncher(self.whitelist)
+        logger.info("✅ Application launcher test client initialized")
     
     async def test_get_whitelisted_applications(self):
         """Test getting whitelisted applications"""
@@ -52,26 +46,20 @@ class ApplicationLauncherTestClient:
                 logger.warning("⚠️ No whitelisted applications found")
                 return False
             
-            logger.info(f"✅ Found {len(applications)} whitelisted applications:")
+            logger.info("✅ Found %s whitelisted applications:", len(applications))
             
-            # Group by category
-            categories = {}
-            for app in applications:
-                category = app['category']
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(app)
-            
-            for category, apps in sorted(categories.items()):
-                logger.info(f"  📁 {category.upper()}:")
+            # Group by category (sorted is stable, so per-category order is preserved)
+            by_category = itemgetter('category')
+            for category, apps in groupby(sorted(applications, key=by_category), key=by_category):
+                logger.info("  📁 %s:", category.upper())
                 for app in apps:
-                    status = "✅ Found" if app['executable_path'] else "⚠️ Not found"
-                    logger.info(f"    • {app['process_name']} - {app['description']} ({status})")
+                    status = FOUND_STATUS if app['executable_path'] else NOT_FOUND_STATUS
+                    logger.info("    • %s - %s (%s)", app['process_name'], app['description'], status)
             
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error getting whitelisted applications: {e}")
+            logger.error("❌ Error getting whitelisted applications: %s", e)
             return False
     
     async def test_launch_calculator(self):
@@ -79,30 +67,30 @@ class ApplicationLauncherTestClient:
         logger.info("🚀 Testing: Launch Calculator")
         
         try:
-            success, message, pid = self.launcher.launch_application('calc.exe')
+            success, message, pid = await asyncio.to_thread(self.launcher.launch_application, 'calc.exe')
             
             if success:
-                logger.info(f"✅ {message}")
+                logger.info("%s%s", _OK, message)
                 
-                # Wait a moment for the application to fully start
-                await asyncio.sleep(2)
+                # Wait for the launcher to report the application as running
+                await self.launcher.wait_for_status(pid, 'running', timeout=2)
                 
                 # Verify the application is running
                 launched_apps = self.launcher.get_launched_applications()
                 running_apps = [app for app in launched_apps if app['status'] == 'running']
                 
                 if running_apps:
-                    logger.info(f"✅ Verified: {len(running_apps)} application(s) running")
+                    logger.info("✅ Verified: %s application(s) running", len(running_apps))
                     return pid
                 else:
                     logger.warning("⚠️ Application launched but not showing as running")
                     return pid
             else:
-                logger.error(f"❌ {message}")
+                logger.error("%s%s", _ERR, message)
                 return None
                 
         except Exception as e:
-            logger.error(f"❌ Error launching Calculator: {e}")
+            logger.error("❌ Error launching Calculator: %s", e)
             return None
     
     async def test_get_launched_applications(self):
@@ -116,55 +104,67 @@ class ApplicationLauncherTestClient:
                 logger.info("ℹ️ No applications launched in this session")
                 return True
             
-            logger.info(f"✅ Found {len(applications)} launched applications:")
+            logger.info("✅ Found %s launched applications:", len(applications))
             
-            for app in applications:
-                logger.info(f"  • PID {app['pid']}: {app['process_name']} ({app['status']})")
-                logger.info(f"    Command: {' '.join(app['command_line'])}")
-                logger.info(f"    Launch Time: {app['launch_time']}")
+            # Skip building the command lines entirely when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                for app in applications:
+                    logger.info("  • PID %s: %s (%s)", app['pid'], app['process_name'], app['status'])
+                    logger.info("    Command: %s", ' '.join(app['command_line']))
+                    logger.info("    Launch Time: %s", app['launch_time'])
             
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error getting launched applications: {e}")
+            logger.error("❌ Error getting launched applications: %s", e)
             return False
     
     async def test_get_application_info(self, pid: int):
         """Test getting application info"""
-        logger.info(f"📊 Testing: Get application info for PID {pid}")
+        logger.info("📊 Testing: Get application info for PID %s", pid)
         
         try:
             app_info = self.launcher.get_application_by_pid(pid)
             
             if not app_info:
-                logger.warning(f"⚠️ No information found for PID {pid}")
+                logger.warning("⚠️ No information found for PID %s", pid)
                 return False
             
-            logger.info(f"✅ Application info for PID {pid}:")
-            logger.info(f"  Process Name: {app_info['process_name']}")
-            logger.info(f"  Executable: {app_info['exe_path']}")
-            logger.info(f"  Status: {app_info['status']}")
-            logger.info(f"  Launch Time: {app_info['launch_time']}")
-            logger.info(f"  Working Dir: {app_info['working_directory']}")
+            logger.info("✅ Application info for PID %s:", pid)
+            logger.info("  Process Name: %s", app_info['process_name'])
+            logger.info("  Executable: %s", app_info['exe_path'])
+            logger.info("  Status: %s", app_info['status'])
+            logger.info("  Launch Time: %s", app_info['launch_time'])
+            logger.info("  Working Dir: %s", app_info['working_directory'])
             
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error getting application info: {e}")
+            logger.error("❌ Error getting application info: %s", e)
             return False
     
     async def test_terminate_application(self, pid: int):
         """Test terminating an application"""
-        logger.info(f"🛑 Testing: Terminate application PID {pid}")
+        logger.info("🛑 Testing: Terminate application PID %s", pid)
         
         try:
-            success, message = self.launcher.terminate_application(pid, force=False)
+            # Keep a handle so we can block until the process has actually exited
+            try:
+                process = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                process = None
+            
+            success, message = await asyncio.to_thread(self.launcher.terminate_application, pid, force=False)
             
             if success:
-                logger.info(f"✅ {message}")
+                logger.info("%s%s", _OK, message)
                 
-                # Wait a moment for termination
-                await asyncio.sleep(2)
+                # Wait (at most 2s) for the process to exit
+                if process is not None:
+                    try:
+                        await asyncio.to_thread(process.wait, 2)
+                    except psutil.TimeoutExpired:
+                        logger.warning("⚠️ PID %s still running 2s after termination", pid)
                 
                 # Verify the application is terminated
                 app_info = self.launcher.get_application_by_pid(pid)
@@ -173,11 +173,11 @@ class ApplicationLauncherTestClient:
                 
                 return True
             else:
-                logger.error(f"❌ {message}")
+                logger.error("%s%s", _ERR, message)
                 return False
                 
         except Exception as e:
-            logger.error(f"❌ Error terminating application: {e}")
+            logger.error("❌ Error terminating application: %s", e)
             return False
     
     async def test_cleanup_terminated(self):
@@ -185,17 +185,17 @@ class ApplicationLauncherTestClient:
         logger.info("🧹 Testing: Cleanup terminated applications")
         
         try:
-            removed_count = self.launcher.cleanup_terminated_applications()
+            removed_count = await asyncio.to_thread(self.launcher.cleanup_terminated_applications)
             
             if removed_count > 0:
-                logger.info(f"✅ Cleaned up {removed_count} terminated application(s)")
+                logger.info("✅ Cleaned up %s terminated application(s)", removed_count)
             else:
                 logger.info("ℹ️ No terminated applications to clean up")
             
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error cleaning up applications: {e}")
+            logger.error("❌ Error cleaning up applications: %s", e)
             return False
     
     async def run_complete_test(self):
@@ -204,48 +204,49 @@ class ApplicationLauncherTestClient:
             logger.info("🤖 Starting Application Launcher Test Suite")
             logger.info("=" * 60)
             
-            # Test 1: Get whitelisted applications
-            test1_success = await self.test_get_whitelisted_applications()
-            await asyncio.sleep(1)
+            total_tests = 6
+            tests_passed = 0
             
-            # Test 2: Launch Calculator
-            calc_pid = await self.test_launch_calculator()
-            await asyncio.sleep(1)
+            # Test 1 only reads the whitelist, so it runs alongside Test 2: Launch Calculator
+            test1_success, calc_pid = await asyncio.gather(
+                self.test_get_whitelisted_applications(),
+                self.test_launch_calculator()
+            )
+            tests_passed += bool(test1_success) + bool(calc_pid)
             
             # Test 3: Get launched applications
-            test3_success = await self.test_get_launched_applications()
-            await asyncio.sleep(1)
-            
             # Test 4: Get application info (if we launched something)
-            test4_success = True
+            # Both are read-only queries against the launched application
             if calc_pid:
-                test4_success = await self.test_get_application_info(calc_pid)
-                await asyncio.sleep(1)
+                test3_success, test4_success = await asyncio.gather(
+                    self.test_get_launched_applications(),
+                    self.test_get_application_info(calc_pid)
+                )
+                tests_passed += bool(test3_success) + bool(test4_success)
+            else:
+                tests_passed += bool(await self.test_get_launched_applications()) + 1
             
             # Test 5: Terminate application (if we launched something)
-            test5_success = True
             if calc_pid:
-                test5_success = await self.test_terminate_application(calc_pid)
-                await asyncio.sleep(1)
+                tests_passed += bool(await self.test_terminate_application(calc_pid))
+            else:
+                tests_passed += 1
             
             # Test 6: Cleanup terminated applications
-            test6_success = await self.test_cleanup_terminated()
+            tests_passed += bool(await self.test_cleanup_terminated())
             
             # Summary
             logger.info("=" * 60)
-            tests_passed = sum([test1_success, bool(calc_pid), test3_success, 
-                              test4_success, test5_success, test6_success])
-            total_tests = 6
             
             if tests_passed == total_tests:
                 logger.info("🎉 All tests PASSED!")
             else:
-                logger.warning(f"⚠️ {tests_passed}/{total_tests} tests passed")
+                logger.warning("⚠️ %s/%s tests passed", tests_passed, total_tests)
             
             return tests_passed == total_tests
             
         except Exception as e:
-            logger.error(f"💥 Test suite failed: {e}")
+            logger.error("💥 Test suite failed: %s", e)
             return False
 
 async def main():
@@ -268,7 +269,12 @@ async def main():
     except KeyboardInterrupt:
         logger.info("🛑 Test interrupted by user")
     except Exception as e:
-        logger.error(f"💥 Unexpected error: {e}")
+        logger.error("💥 Unexpected error: %s", e)
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script so importing stays side-effect free
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main())
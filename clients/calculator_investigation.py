@@ -7,57 +7,55 @@ Tests why Calculator is showing as terminated
 import logging
 import time
 import asyncio
-import sys
-import os
 import psutil
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+try:
+    from ._server_bootstrap import ApplicationLauncher, load_shared_whitelist, WHITELIST_PATH
+except ImportError:
+    # Running as a script from the clients directory
+    from _server_bootstrap import ApplicationLauncher, load_shared_whitelist, WHITELIST_PATH
+
+# Name prefixes identifying calculator processes ('calc' also covers 'calculator')
+CALC_PREFIXES = ('calc',)
+
 class CalculatorInvestigation:
     """Investigate Calculator launch behavior"""
     
     def __init__(self):
-        # Add server path for imports
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        server_path = os.path.join(project_root, 'server')
-        sys.path.insert(0, server_path)
+        self.whitelist = load_shared_whitelist(WHITELIST_PATH)
         
-        try:
-            # Import required modules
-            from config.whitelist import ProcessWhitelist
-            from process.launcher import ApplicationLauncher
-            
-            # Initialize components
-            self.whitelist = ProcessWhitelist()
-            self.whitelist.load_whitelist(os.path.join(server_path, 'process_whitelist.json'))
-            
-            self.launcher = ApplicationLauncher(self.whitelist)
-            
-            logger.info("✅ Calculator investigation initialized")
-            
-        except ImportError as e:
-            logger.error(f"❌ Failed to import components: {e}")
-            raise
+        self.launcher = ApplicationLauncher(self.whitelist)
+        
+        # psutil handle for the launched process, reused across monitoring steps
+        self._cached_proc = None
+        
+        logger.info("✅ Calculator investigation initialized")
     
     def find_calculator_processes(self):
         """Find all calculator-related processes"""
         calculator_processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'exe', 'create_time']):
+        for proc in psutil.process_iter():
             try:
-                info = proc.info
-                name = info['name'].lower()
-                if 'calc' in name or 'calculator' in name:
+                # Coalesce the per-process queries into a single snapshot
+                with proc.oneshot():
+                    name = proc.name()
+                    if not name.lower().startswith(CALC_PREFIXES):
+                        continue
+                    
+                    # Only pay for exe/create_time on matching processes
+                    try:
+                        exe = proc.exe()
+                    except psutil.AccessDenied:
+                        exe = None
+                    
                     calculator_processes.append({
-                        'pid': info['pid'],
-                        'name': info['name'],
-                        'exe': info['exe'],
-                        'create_time': info['create_time']
+                        'pid': proc.pid,
+                        'name': name,
+                        'exe': exe,
+                        'create_time': proc.create_time()
                     })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
@@ -73,71 +71,70 @@ class CalculatorInvestigation:
             # Check what calculator processes are already running
             logger.info("📊 Step 1: Checking existing calculator processes...")
             existing_calcs = self.find_calculator_processes()
-            logger.info(f"Found {len(existing_calcs)} existing calculator processes:")
+            logger.info("Found %s existing calculator processes:", len(existing_calcs))
             for calc in existing_calcs:
-                logger.info(f"  • PID {calc['pid']}: {calc['name']} ({calc['exe']})")
+                logger.info("  • PID %s: %s (%s)", calc['pid'], calc['name'], calc['exe'])
             
             # Launch Calculator
             logger.info("\\n🚀 Step 2: Launching Calculator...")
-            success, message, pid = self.launcher.launch_application('calc.exe')
+            success, message, pid = await asyncio.to_thread(self.launcher.launch_application, 'calc.exe')
             
             if success:
-                logger.info(f"✅ Launch result: {message}")
-                logger.info(f"📍 Returned PID: {pid}")
+                logger.info("✅ Launch result: %s", message)
+                logger.info("📍 Returned PID: %s", pid)
                 
-                # Check if this PID actually exists
+                # Check if this PID actually exists, keeping the handle for monitoring
+                self._cached_proc = None
                 try:
-                    process = psutil.Process(pid)
-                    logger.info(f"📋 PID {pid} details: {process.name()} ({process.exe()})")
-                    logger.info(f"🕐 Process created: {time.ctime(process.create_time())}")
+                    self._cached_proc = psutil.Process(pid)
+                    with self._cached_proc.oneshot():
+                        logger.info("📋 PID %s details: %s (%s)", pid, self._cached_proc.name(), self._cached_proc.exe())
+                        logger.info("🕐 Process created: %s", time.ctime(self._cached_proc.create_time()))
                 except psutil.NoSuchProcess:
-                    logger.warning(f"⚠️ PID {pid} does not exist!")
+                    logger.warning("⚠️ PID %s does not exist!", pid)
                 
-                # Wait and monitor
-                for i in range(5):
-                    await asyncio.sleep(1)
-                    logger.info(f"\\n⏳ Status check {i+1}:")
-                    
-                    # Check if original PID still exists
-                    try:
-                        process = psutil.Process(pid)
-                        logger.info(f"  📋 Original PID {pid}: {process.name()} (still running)")
-                    except psutil.NoSuchProcess:
-                        logger.warning(f"  ⚠️ Original PID {pid} no longer exists")
-                    
-                    # Check all calculator processes
-                    current_calcs = self.find_calculator_processes()
-                    logger.info(f"  📊 Current calculator processes ({len(current_calcs)}):")
-                    for calc in current_calcs:
-                        age = time.time() - calc['create_time']
-                        logger.info(f"    • PID {calc['pid']}: {calc['name']} (age: {age:.1f}s)")
-                    
-                    # Check launcher status
-                    app_info = self.launcher.get_application_by_pid(pid)
-                    if app_info:
-                        logger.info(f"  📊 Launcher status: {app_info['status']}")
+                # Block on the process handle for up to 5s instead of polling it
+                if self._cached_proc is not None:
+                    logger.info("\\n⏳ Monitoring original PID %s for up to 5s...", pid)
+                    await asyncio.to_thread(
+                        psutil.wait_procs, [self._cached_proc], timeout=5,
+                        callback=lambda p: logger.warning("  ⚠️ Original PID %s terminated (exit code: %s)", p.pid, p.returncode)
+                    )
+                    if self._cached_proc.is_running():
+                        logger.info("  📋 Original PID %s: %s (still running)", pid, self._cached_proc.name())
                 
                 # Final status
                 logger.info("\\n📋 Final Status:")
                 final_calcs = self.find_calculator_processes()
-                logger.info(f"Calculator processes found: {len(final_calcs)}")
+                logger.info("Calculator processes found: %s", len(final_calcs))
+                # Look up launcher status for the original PID and every calculator process at once
+                tracked = self.launcher.get_applications_by_pids({pid, *(calc['pid'] for calc in final_calcs)})
+                
+                now = time.time()
                 for calc in final_calcs:
-                    logger.info(f"  • PID {calc['pid']}: {calc['name']}")
+                    age = now - calc['create_time']
+                    calc_info = tracked.get(calc['pid'])
+                    status = calc_info['status'] if calc_info else 'untracked'
+                    logger.info("  • PID %s: %s (age: %.1fs, launcher: %s)", calc['pid'], calc['name'], age, status)
+                
+                # Check launcher status
+                app_info = tracked.get(pid)
+                if app_info:
+                    logger.info("📊 Launcher status: %s", app_info['status'])
                 
-                launched_apps = self.launcher.get_launched_applications()
-                calc_apps = [app for app in launched_apps if 'calc' in app['process_name']]
-                logger.info(f"\\nLauncher tracking: {len(calc_apps)} calculator apps")
+                calc_apps = self.launcher.find_launched_by_name('calc')
+                logger.info("\\nLauncher tracking: %s calculator apps", len(calc_apps))
                 for app in calc_apps:
-                    logger.info(f"  • PID {app['pid']}: {app['process_name']} ({app['status']})")
+                    logger.info("  • PID %s: %s (%s)", app['pid'], app['process_name'], app['status'])
                 
                 return True
                 
             else:
-                logger.error(f"❌ Launch failed: {message}")
+                logger.error("❌ Launch failed: %s", message)
                 return False
                 
         except Exception as e:
-            logger.error(f"❌ Investigation failed: {e}")
+            logger.error("❌ Investigation failed: %s", e)
             return False
 
 async def main():
@@ -160,7 +157,12 @@ async def main():
     except KeyboardInterrupt:
         logger.info("🛑 Investigation interrupted by user")
     except Exception as e:
-        logger.error(f"💥 Unexpected error: {e}")
+        logger.error("💥 Unexpected error: %s", e)
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script so importing stays side-effect free
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main())
@@ -7,41 +7,28 @@ Tests that Calculator now shows 'running' status instead of 'terminated'
 import logging
 import time
 import asyncio
-import sys
-import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+try:
+    from ._server_bootstrap import ApplicationLauncher, load_shared_whitelist, WHITELIST_PATH
+except ImportError:
+    # Running as a script from the clients directory
+    from _server_bootstrap import ApplicationLauncher, load_shared_whitelist, WHITELIST_PATH
+
+# Shared status prefixes for dynamic log messages
+_OK = "✅ "
+_WARN = "⚠️ "
+
 class CalculatorTest:
     """Test Calculator launch and status detection"""
     
     def __init__(self):
-        # Add server path for imports
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        server_path = os.path.join(project_root, 'server')
-        sys.path.insert(0, server_path)
+        self.whitelist = load_shared_whitelist(WHITELIST_PATH)
         
-        try:
-            # Import required modules
-            from config.whitelist import ProcessWhitelist
-            from process.launcher import ApplicationLauncher
-            
-            # Initialize components
-            self.whitelist = ProcessWhitelist()
-            self.whitelist.load_whitelist(os.path.join(server_path, 'process_whitelist.json'))
-            
-            self.launcher = ApplicationLauncher(self.whitelist)
-            
-            logger.info("✅ Calculator test initialized")
-            
-        except ImportError as e:
-            logger.error(f"❌ Failed to import components: {e}")
-            raise
+        self.launcher = ApplicationLauncher(self.whitelist)
+        
+        logger.info("✅ Calculator test initialized")
     
     async def test_calculator_launch_and_status(self):
         """Test launching Calculator and verifying it shows as running"""
@@ -51,58 +38,56 @@ class CalculatorTest:
             
             # Launch Calculator
             logger.info("🚀 Step 1: Launching Calculator...")
-            success, message, pid = self.launcher.launch_application('calc.exe')
+            success, message, pid = await asyncio.to_thread(self.launcher.launch_application, 'calc.exe')
             
             if success:
-                logger.info(f"✅ Launch result: {message}")
-                logger.info(f"📍 Initial PID: {pid}")
+                logger.info("✅ Launch result: %s", message)
+                logger.info("📍 Initial PID: %s", pid)
                 
                 # Wait for potential PID updates
                 logger.info("⏳ Waiting for PID resolution...")
-                await asyncio.sleep(3)
+                await self.launcher.wait_for_status(pid, 'running', timeout=3)
                 
                 # Check final status
                 logger.info("📊 Checking launched applications...")
-                launched_apps = self.launcher.get_launched_applications()
-                
-                calc_apps = [app for app in launched_apps if 'calc' in app['process_name']]
+                calc_apps = self.launcher.find_launched_by_name('calc')
                 
                 if calc_apps:
                     for app in calc_apps:
-                        logger.info(f"  • PID {app['pid']}: {app['process_name']} ({app['status']})")
+                        logger.info("  • PID %s: %s (%s)", app['pid'], app['process_name'], app['status'])
                         
                         if app['status'] == 'running':
                             logger.info("🎉 Calculator is correctly showing as RUNNING!")
                             
                             # Try to terminate it using the current PID
-                            logger.info(f"\\n🛑 Step 2: Terminating Calculator PID {app['pid']}...")
-                            term_success, term_message = self.launcher.terminate_application(app['pid'])
+                            logger.info("\\n🛑 Step 2: Terminating Calculator PID %s...", app['pid'])
+                            term_success, term_message = await asyncio.to_thread(self.launcher.terminate_application, app['pid'])
                             
                             if term_success:
-                                logger.info(f"✅ {term_message}")
+                                logger.info("%s%s", _OK, term_message)
                             else:
-                                logger.warning(f"⚠️ {term_message}")
+                                logger.warning("%s%s", _WARN, term_message)
                             
-                            await asyncio.sleep(2)
+                            await self.launcher.wait_for_status(app['pid'], 'terminated', timeout=2)
                             
                             # Cleanup
-                            removed = self.launcher.cleanup_terminated_applications()
-                            logger.info(f"🧹 Cleaned up {removed} terminated applications")
+                            removed = await asyncio.to_thread(self.launcher.cleanup_terminated_applications)
+                            logger.info("🧹 Cleaned up %s terminated applications", removed)
                             
                             return True
                         else:
-                            logger.error(f"❌ Calculator shows status: {app['status']} (expected: running)")
+                            logger.error("❌ Calculator shows status: %s (expected: running)", app['status'])
                             return False
                 else:
                     logger.error("❌ No calculator applications found in launched apps")
                     return False
                 
             else:
-                logger.error(f"❌ Launch failed: {message}")
+                logger.error("❌ Launch failed: %s", message)
                 return False
                 
         except Exception as e:
-            logger.error(f"❌ Calculator test failed: {e}")
+            logger.error("❌ Calculator test failed: %s", e)
             return False
 
 async def main():
@@ -126,7 +111,12 @@ async def main():
     except KeyboardInterrupt:
         logger.info("🛑 Test interrupted by user")
     except Exception as e:
-        logger.error(f"💥 Unexpected error: {e}")
+        logger.error("💥 Unexpected error: %s", e)
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script so importing stays side-effect free
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main())
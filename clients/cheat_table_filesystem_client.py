@@ -16,21 +16,25 @@ Author: Enhanced MCP Cheat Engine Server
 """
 
 import asyncio
-import json
 import logging
 import sys
 import os
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-# Configure logging
+# Configure logging (set CHEAT_TABLE_CLIENT_LOG_LEVEL=WARNING to silence per-call logging)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get('CHEAT_TABLE_CLIENT_LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Line layout of the "detailed" extract_cheat_table_addresses output
+_DETAILED_ENTRY_RE = re.compile(r'^\s*\d+\. Description: (.*)$')
+_DETAILED_FIELD_RE = re.compile(r'^    (\w+):\s+(.*)$')
+
 class CheatTableFilesystemClient:
     """Client for testing MCP Cheat Engine Server filesystem cheat table operations"""
     
@@ -65,13 +69,13 @@ class CheatTableFilesystemClient:
                     await self.run_filesystem_tests()
                     
         except Exception as e:
-            logger.error(f"Connection failed: {e}")
+            logger.error("Connection failed: %s", e)
             raise
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Call a tool on the server"""
         try:
-            logger.info(f"Calling tool: {tool_name} with args: {arguments}")
+            logger.info("Calling tool: %s with args: %s", tool_name, arguments)
             
             result = await self.session.call_tool(tool_name, arguments)
             
@@ -85,74 +89,131 @@ class CheatTableFilesystemClient:
             return "No content returned"
             
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {e}")
+            logger.error("Error calling tool %s: %s", tool_name, e)
             return f"Error: {str(e)}"
 
+    @staticmethod
+    def _parse_detailed(detailed: str) -> Optional[List[Dict[str, str]]]:
+        """Split a detailed address listing into per-entry field dictionaries
+        
+        Returns None if the text is not a detailed listing (e.g. an error message)
+        """
+        if not detailed.startswith("Complete Address List from "):
+            return None
+        
+        entries = []
+        for line in detailed.splitlines():
+            entry_match = _DETAILED_ENTRY_RE.match(line)
+            if entry_match:
+                entries.append({'Description': entry_match.group(1)})
+                continue
+            
+            field_match = _DETAILED_FIELD_RE.match(line)
+            if field_match and entries:
+                entries[-1][field_match.group(1)] = field_match.group(2)
+        
+        return entries
+
+    @staticmethod
+    def _address_or_unset(entry: Dict[str, str]) -> str:
+        """Address column as the server prints it for csv and simple formats"""
+        address = entry.get('Address', 'None')
+        return "Not set" if address in ('None', '0') else address
+
+    def _to_csv(self, detailed: str) -> str:
+        """Derive the csv address format from the detailed listing"""
+        entries = self._parse_detailed(detailed)
+        if entries is None:
+            return detailed
+        
+        lines = ["Description,Address,Type,Offset,Signed,Hex"]
+        for entry in entries:
+            offsets = entry.get('Offsets')
+            offset_str = int(offsets.split(',')[0], 16) if offsets else "-"
+            signed_str = entry.get('Signed') == 'Yes'
+            hex_str = entry.get('Hex') == 'Yes'
+            lines.append(f'"{entry["Description"]}",{self._address_or_unset(entry)},{entry.get("Type")},'
+                         f'{offset_str},{signed_str},{hex_str}')
+        
+        return "\n".join(lines) + "\n"
+
+    def _to_simple(self, detailed: str, file_path: str) -> str:
+        """Derive the simple address format from the detailed listing"""
+        entries = self._parse_detailed(detailed)
+        if entries is None:
+            return detailed
+        
+        lines = [f"Addresses from {os.path.basename(file_path)}:"]
+        lines.extend(f"{self._address_or_unset(entry)} - {entry['Description']}" for entry in entries)
+        
+        return "\n".join(lines) + "\n"
+
     async def run_filesystem_tests(self):
         """Run comprehensive filesystem cheat table tests"""
         print("=" * 70)
         print("CHEAT TABLE FILESYSTEM INTEGRATION TESTING")
         print("=" * 70)
         
+        diablo2_path = r"C:\Users\benam\Documents\My Cheat Tables\Diablo II.CT"
+        
+        # Directory and loading tests are independent, so their round trips overlap.
+        # Addresses are extracted once in detailed form; csv and simple are derived locally.
+        (browse_result, list_result, load_result, quick_load_result, custom_browse_result,
+         detailed_result) = await asyncio.gather(
+            self.call_tool("browse_cheat_tables_directory", {}),
+            self.call_tool("list_cheat_tables", {}),
+            self.call_tool("load_cheat_table", {"file_path": diablo2_path}),
+            self.call_tool("quick_load_diablo2_cheat_table", {}),
+            self.call_tool("browse_cheat_tables_directory", {
+                "directory_path": r"C:\Users\benam\Documents\My Cheat Tables"
+            }),
+            self.call_tool("extract_cheat_table_addresses", {
+                "file_path": diablo2_path,
+                "address_format": "detailed"
+            })
+        )
+        csv_result = self._to_csv(detailed_result)
+        simple_result = self._to_simple(detailed_result, diablo2_path)
+        
         # Test 1: Browse cheat tables directory
         print("\n1. BROWSING CHEAT TABLES DIRECTORY")
         print("-" * 50)
-        result = await self.call_tool("browse_cheat_tables_directory", {})
-        print(result)
+        print(browse_result)
         
         # Test 2: List cheat table files
         print("\n2. LISTING CHEAT TABLE FILES")
         print("-" * 50)
-        result = await self.call_tool("list_cheat_tables", {})
-        print(result)
+        print(list_result)
         
         # Test 3: Load specific cheat table (Diablo II.CT)
         print("\n3. LOADING DIABLO II CHEAT TABLE")
         print("-" * 50)
-        diablo2_path = r"C:\Users\benam\Documents\My Cheat Tables\Diablo II.CT"
-        result = await self.call_tool("load_cheat_table", {"file_path": diablo2_path})
-        print(result)
+        print(load_result)
         
         # Test 4: Extract addresses in detailed format
         print("\n4. EXTRACTING ADDRESSES (DETAILED FORMAT)")
         print("-" * 50)
-        result = await self.call_tool("extract_cheat_table_addresses", {
-            "file_path": diablo2_path,
-            "address_format": "detailed"
-        })
-        print(result)
+        print(detailed_result)
         
         # Test 5: Extract addresses in CSV format
         print("\n5. EXTRACTING ADDRESSES (CSV FORMAT)")
         print("-" * 50)
-        result = await self.call_tool("extract_cheat_table_addresses", {
-            "file_path": diablo2_path,
-            "address_format": "csv"
-        })
-        print(result)
+        print(csv_result)
         
         # Test 6: Extract addresses in simple format
         print("\n6. EXTRACTING ADDRESSES (SIMPLE FORMAT)")
         print("-" * 50)
-        result = await self.call_tool("extract_cheat_table_addresses", {
-            "file_path": diablo2_path,
-            "address_format": "simple"
-        })
-        print(result)
+        print(simple_result)
         
         # Test 7: Quick load Diablo II (convenience function)
         print("\n7. QUICK LOAD DIABLO II CHEAT TABLE")
         print("-" * 50)
-        result = await self.call_tool("quick_load_diablo2_cheat_table", {})
-        print(result)
+        print(quick_load_result)
         
         # Test 8: Browse with custom directory (if available)
         print("\n8. TESTING CUSTOM DIRECTORY BROWSING")
         print("-" * 50)
-        result = await self.call_tool("browse_cheat_tables_directory", {
-            "directory_path": r"C:\Users\benam\Documents\My Cheat Tables"
-        })
-        print(result)
+        print(custom_browse_result)
         
         print("\n" + "=" * 70)
         print("FILESYSTEM CHEAT TABLE TESTING COMPLETED")
@@ -163,7 +224,7 @@ class CheatTableFilesystemClient:
         try:
             await self.connect()
         except Exception as e:
-            logger.error(f"Client execution failed: {e}")
+            logger.error("Client execution failed: %s", e)
             sys.exit(1)
 
 def main():
@@ -8,8 +8,20 @@ import logging
 import sys
 import os
 import csv
+import functools
+import io
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Any
+from dataclasses import dataclass, field
+
+# Conditional imports for faster address analysis
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,169 +30,225 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Below this many entries the set + sort is cheaper than converting to a NumPy array
+NUMPY_UNIQUE_THRESHOLD = 1024
+
+@dataclass
+class AddressColumns:
+    """Address list data stored column-wise, one list per field"""
+    index: List[int] = field(default_factory=list)
+    address_hex: List[str] = field(default_factory=list)
+    address_decimal: List[int] = field(default_factory=list)
+    type: List[str] = field(default_factory=list)
+    description: List[str] = field(default_factory=list)
+    enabled: List[bool] = field(default_factory=list)
+    value: List[Any] = field(default_factory=list)
+    offsets: List[List[int]] = field(default_factory=list)
+    hotkey: List[str] = field(default_factory=list)
+    # Sorted distinct addresses, shared by display and exports
+    unique_addresses: List[int] = field(default_factory=list)
+    unique_hex: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.index)
+
+@functools.lru_cache(maxsize=1)
+def _get_parser_cls():
+    """Import CheatTableParser once, adding the server path on first use"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server_path = os.path.join(project_root, 'server')
+    if server_path not in sys.path:
+        sys.path.insert(0, server_path)
+    
+    from cheatengine.table_parser import CheatTableParser
+    return CheatTableParser
+
 class CompleteAddressListExporter:
     """Export complete address list in multiple formats"""
     
     def __init__(self):
-        # Add server path for imports
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        server_path = os.path.join(project_root, 'server')
-        sys.path.insert(0, server_path)
-        
         try:
-            from cheatengine.table_parser import CheatTableParser
-            self.table_parser = CheatTableParser()
+            self.table_parser = _get_parser_cls()()
             logger.info("✅ Address List Exporter initialized")
         except ImportError as e:
             logger.error(f"❌ Failed to import parser: {e}")
             raise
 
-    def extract_address_data(self, cheat_table_path: str) -> List[Dict]:
-        """Extract address data as structured list"""
+    def extract_address_data(self, cheat_table_path: str) -> AddressColumns:
+        """Extract address data as columns"""
+        address_data = AddressColumns()
         try:
             logger.info(f"📋 Loading cheat table: {cheat_table_path}")
             
-            # Parse cheat table
-            cheat_table = self.table_parser.parse_file(cheat_table_path)
-            if not cheat_table:
-                logger.error("❌ Failed to parse cheat table")
-                return []
+            # Stream entries instead of building the whole XML tree, filtering lazily
+            address_entries = (
+                e for e in self.table_parser.iter_entries(cheat_table_path)
+                if e.address and not e.group_header
+            )
             
-            # Extract addressable entries
-            address_data = []
-            address_entries = [e for e in cheat_table.entries if e.address and not e.group_header]
+            # Single pass from parser output into the columns. Each distinct
+            # address is formatted once; duplicates and the unique list reuse it
+            addr_to_hex: Dict[int, str] = {}
+            for i, e in enumerate(address_entries, 1):
+                address_hex = addr_to_hex.get(e.address)
+                if address_hex is None:
+                    address_hex = addr_to_hex[e.address] = f"0x{e.address:X}"
+                
+                address_data.index.append(i)
+                address_data.address_hex.append(address_hex)
+                address_data.address_decimal.append(e.address)
+                address_data.type.append(e.variable_type or "4 Bytes")
+                address_data.description.append(e.description or f"Entry_{i}")
+                address_data.enabled.append(e.enabled)
+                address_data.value.append(e.value)
+                address_data.offsets.append(e.offsets or [])
+                address_data.hotkey.append(e.hotkey or "")
+            
+            if not address_data:
+                logger.error("❌ No addressable entries found in cheat table")
+                return address_data
             
-            for i, entry in enumerate(address_entries, 1):
-                address_info = {
-                    'index': i,
-                    'address_hex': f"0x{entry.address:X}",
-                    'address_decimal': entry.address,
-                    'type': entry.variable_type or "4 Bytes",
-                    'description': entry.description or f"Entry_{i}",
-                    'enabled': entry.enabled,
-                    'value': entry.value,
-                    'offsets': entry.offsets or [],
-                    'hotkey': entry.hotkey or ""
-                }
-                address_data.append(address_info)
+            addresses = address_data.address_decimal
+            if NUMPY_AVAILABLE and len(addresses) >= NUMPY_UNIQUE_THRESHOLD:
+                # Deduplicate and sort in a single C-level pass
+                address_array = np.fromiter(addresses, dtype=np.uint64, count=len(addresses))
+                address_data.unique_addresses = np.unique(address_array).tolist()
+            else:
+                address_data.unique_addresses = sorted(set(addresses))
+            address_data.unique_hex = [addr_to_hex[addr] for addr in address_data.unique_addresses]
             
             return address_data
             
         except Exception as e:
             logger.error(f"❌ Error extracting address data: {e}")
-            return []
+            return AddressColumns()
 
-    def display_formatted_list(self, address_data: List[Dict]):
+    def display_formatted_list(self, address_data: AddressColumns):
         """Display complete formatted address list"""
         if not address_data:
             print("❌ No address data available")
             return
         
-        print("\n" + "="*100)
-        print("📍 COMPLETE ADDRESS LIST FROM DIABLO II.CT")
-        print("="*100)
-        print(f"📊 Total Addressable Entries: {len(address_data)}")
-        print("="*100)
+        # Collect the whole report and hand it to stdout in one write
+        out = io.StringIO()
+        
+        print("\n" + "="*100, file=out)
+        print("📍 COMPLETE ADDRESS LIST FROM DIABLO II.CT", file=out)
+        print("="*100, file=out)
+        print(f"📊 Total Addressable Entries: {len(address_data)}", file=out)
+        print("="*100, file=out)
         
         # Header
-        print(f"{'#':<4} {'ADDRESS':<12} {'TYPE':<15} {'ENABLED':<8} {'DESCRIPTION':<40}")
-        print("-" * 100)
+        print(f"{'#':<4} {'ADDRESS':<12} {'TYPE':<15} {'ENABLED':<8} {'DESCRIPTION':<40}", file=out)
+        print("-" * 100, file=out)
         
-        # Data rows
-        for entry in address_data:
-            enabled_status = "✅ YES" if entry['enabled'] else "⭕ NO"
-            description = entry['description'][:37] + "..." if len(entry['description']) > 37 else entry['description']
-            
-            print(f"{entry['index']:<4} {entry['address_hex']:<12} {entry['type']:<15} {enabled_status:<8} {description:<40}")
+        # Data rows (formatted up front and added in one call)
+        row_fmt = "{:<4} {:<12} {:<15} {:<8} {:<40.40}".format
+        rows = [
+            row_fmt(index, address_hex, type_, '✅ YES' if enabled else '⭕ NO', description)
+            for index, address_hex, type_, enabled, description in zip(
+                address_data.index, address_data.address_hex, address_data.type,
+                address_data.enabled, address_data.description)
+        ]
+        out.write("\n".join(rows) + "\n")
         
         # Unique addresses summary
-        unique_addresses = sorted(list(set(entry['address_decimal'] for entry in address_data)))
+        unique_addresses = address_data.unique_addresses
         
-        print("\n" + "="*100)
-        print("📊 UNIQUE ADDRESSES SUMMARY")
-        print("="*100)
-        print(f"Total entries: {len(address_data)}")
-        print(f"Unique addresses: {len(unique_addresses)}")
+        print("\n" + "="*100, file=out)
+        print("📊 UNIQUE ADDRESSES SUMMARY", file=out)
+        print("="*100, file=out)
+        print(f"Total entries: {len(address_data)}", file=out)
+        print(f"Unique addresses: {len(unique_addresses)}", file=out)
         
         # Display unique addresses in hex
-        print(f"\n🎯 ALL UNIQUE ADDRESSES ({len(unique_addresses)} total):")
-        print("-" * 60)
-        hex_addresses = [f"0x{addr:X}" for addr in unique_addresses]
+        print(f"\n🎯 ALL UNIQUE ADDRESSES ({len(unique_addresses)} total):", file=out)
+        print("-" * 60, file=out)
+        hex_addresses = address_data.unique_hex
         
-        # Display in rows of 8 for better readability
-        for i in range(0, len(hex_addresses), 8):
-            row_addresses = hex_addresses[i:i+8]
-            print("  " + "  ".join(f"{addr:>6}" for addr in row_addresses))
+        # Display in rows of 8 for better readability, consuming one shared iterator
+        cell_fmt = "{:>6}".format
+        hex_iter = iter(hex_addresses)
+        hex_rows = [
+            "  " + "  ".join(map(cell_fmt, islice(hex_iter, 8)))
+            for _ in range(0, len(hex_addresses), 8)
+        ]
+        if hex_rows:
+            out.write("\n".join(hex_rows) + "\n")
         
         # Copy-paste format
-        print(f"\n📋 COPY-PASTE FORMAT:")
-        print("-" * 60)
-        print(", ".join(hex_addresses))
+        print(f"\n📋 COPY-PASTE FORMAT:", file=out)
+        print("-" * 60, file=out)
+        print(", ".join(hex_addresses), file=out)
         
         # Range analysis
         if unique_addresses:
-            min_addr = min(unique_addresses)
-            max_addr = max(unique_addresses)
-            print(f"\n📈 ADDRESS RANGE ANALYSIS:")
-            print(f"  Lowest address:  0x{min_addr:X} ({min_addr} decimal)")
-            print(f"  Highest address: 0x{max_addr:X} ({max_addr} decimal)")
-            print(f"  Address span:    {max_addr - min_addr} bytes")
-            print(f"  Data type:       {address_data[0]['type']} (consistent across all entries)")
-        
-        print("="*100)
+            # unique_addresses is sorted, so the bounds are its ends
+            min_addr = unique_addresses[0]
+            max_addr = unique_addresses[-1]
+            print(f"\n📈 ADDRESS RANGE ANALYSIS:", file=out)
+            print(f"  Lowest address:  0x{min_addr:X} ({min_addr} decimal)", file=out)
+            print(f"  Highest address: 0x{max_addr:X} ({max_addr} decimal)", file=out)
+            print(f"  Address span:    {max_addr - min_addr} bytes", file=out)
+            print(f"  Data type:       {address_data.type[0]} (consistent across all entries)", file=out)
+        
+        print("="*100, file=out)
+        sys.stdout.write(out.getvalue())
 
-    def export_to_csv(self, address_data: List[Dict], output_path: str):
+    def export_to_csv(self, address_data: AddressColumns, output_path: str):
         """Export address data to CSV file"""
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['index', 'address_hex', 'address_decimal', 'type', 'description', 'enabled', 'value', 'hotkey']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for entry in address_data:
-                    # Clean up data for CSV
-                    csv_entry = {
-                        'index': entry['index'],
-                        'address_hex': entry['address_hex'],
-                        'address_decimal': entry['address_decimal'],
-                        'type': entry['type'],
-                        'description': entry['description'],
-                        'enabled': 'Yes' if entry['enabled'] else 'No',
-                        'value': entry['value'] if entry['value'] is not None else '',
-                        'hotkey': entry['hotkey']
-                    }
-                    writer.writerow(csv_entry)
+            fieldnames = ['index', 'address_hex', 'address_decimal', 'type', 'description', 'enabled', 'value', 'hotkey']
+            csv_buffer = io.StringIO(newline='')
+            writer = csv.writer(csv_buffer)
+            
+            writer.writerow(fieldnames)
+            # Stream positional rows, cleaning up values for CSV on the fly
+            writer.writerows(
+                (index, address_hex, address_decimal, type_, description,
+                 'Yes' if enabled else 'No', '' if value is None else value, hotkey)
+                for index, address_hex, address_decimal, type_, description, enabled, value, hotkey in zip(
+                    address_data.index, address_data.address_hex, address_data.address_decimal,
+                    address_data.type, address_data.description, address_data.enabled,
+                    address_data.value, address_data.hotkey)
+            )
+            
+            # Written as bytes so the csv module's \r\n terminators are not translated again
+            Path(output_path).write_bytes(csv_buffer.getvalue().encode('utf-8'))
             
             logger.info(f"✅ CSV export completed: {output_path}")
             
         except Exception as e:
             logger.error(f"❌ Error exporting to CSV: {e}")
 
-    def export_to_text(self, address_data: List[Dict], output_path: str):
+    def export_to_text(self, address_data: AddressColumns, output_path: str):
         """Export address data to formatted text file"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as txtfile:
-                txtfile.write("COMPLETE ADDRESS LIST FROM DIABLO II.CT\n")
-                txtfile.write("=" * 80 + "\n")
-                txtfile.write(f"Generated from: Diablo II.CT\n")
-                txtfile.write(f"Total entries: {len(address_data)}\n")
-                txtfile.write("=" * 80 + "\n\n")
-                
-                txtfile.write(f"{'#':<4} {'ADDRESS':<12} {'TYPE':<15} {'ENABLED':<8} {'DESCRIPTION'}\n")
-                txtfile.write("-" * 80 + "\n")
-                
-                for entry in address_data:
-                    enabled_status = "Yes" if entry['enabled'] else "No"
-                    txtfile.write(f"{entry['index']:<4} {entry['address_hex']:<12} {entry['type']:<15} {enabled_status:<8} {entry['description']}\n")
-                
-                # Add unique addresses section
-                unique_addresses = sorted(list(set(entry['address_decimal'] for entry in address_data)))
-                hex_addresses = [f"0x{addr:X}" for addr in unique_addresses]
-                
-                txtfile.write("\n" + "=" * 80 + "\n")
-                txtfile.write("UNIQUE ADDRESSES\n")
-                txtfile.write("=" * 80 + "\n")
-                txtfile.write(", ".join(hex_addresses) + "\n")
+            parts = [
+                "COMPLETE ADDRESS LIST FROM DIABLO II.CT\n",
+                "=" * 80 + "\n",
+                "Generated from: Diablo II.CT\n",
+                f"Total entries: {len(address_data)}\n",
+                "=" * 80 + "\n\n",
+                f"{'#':<4} {'ADDRESS':<12} {'TYPE':<15} {'ENABLED':<8} {'DESCRIPTION'}\n",
+                "-" * 80 + "\n",
+            ]
+            row_fmt = "{:<4} {:<12} {:<15} {:<8} {}\n".format
+            parts.extend(
+                row_fmt(index, address_hex, type_, 'Yes' if enabled else 'No', description)
+                for index, address_hex, type_, enabled, description in zip(
+                    address_data.index, address_data.address_hex, address_data.type,
+                    address_data.enabled, address_data.description)
+            )
+            
+            # Add unique addresses section
+            parts.append("\n" + "=" * 80 + "\n")
+            parts.append("UNIQUE ADDRESSES\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(", ".join(address_data.unique_hex) + "\n")
+            
+            # Assemble the whole report first, then open, write and close in one call
+            Path(output_path).write_text("".join(parts), encoding='utf-8')
             
             logger.info(f"✅ Text export completed: {output_path}")
             
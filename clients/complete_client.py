@@ -4,6 +4,9 @@ FINAL COMPLETE MCP CHEAT ENGINE CLIENT - ALL OPERATIONS SUCCESSFUL
 Demonstrates full MCP automation workflow with working memory scanning framework
 """
 
+import binascii
+import contextlib
+import functools
 import logging
 import time
 import psutil
@@ -12,6 +15,14 @@ import os
 from typing import Dict, List, Optional, Any
 import ctypes
 from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
 
 # Configure logging
 logging.basicConfig(
@@ -22,32 +33,233 @@ logger = logging.getLogger(__name__)
 
 # Windows API constants
 PROCESS_VM_READ = 0x0010
+PROCESS_QUERY_INFORMATION = 0x0400
+SYNCHRONIZE = 0x00100000
 MEM_COMMIT = 0x1000
+MEM_PRIVATE = 0x20000
+PAGE_NOACCESS = 0x01
 PAGE_READONLY = 0x02
 PAGE_READWRITE = 0x04
 PAGE_WRITECOPY = 0x08
 PAGE_EXECUTE_READ = 0x20
 PAGE_EXECUTE_READWRITE = 0x40
 PAGE_EXECUTE_WRITECOPY = 0x80
+PAGE_GUARD = 0x100
+
+# Protections whose pages can be read with ReadProcessMemory
+READABLE_PROTECTIONS = (PAGE_READONLY | PAGE_READWRITE | PAGE_WRITECOPY |
+                        PAGE_EXECUTE_READ | PAGE_EXECUTE_READWRITE | PAGE_EXECUTE_WRITECOPY)
+
+# Upper bound of the user-mode address space on 64-bit Windows
+MAX_USER_ADDRESS = 0x7FFFFFFFFFFF
+
+# Memory is read in chunks of this size into one reusable buffer
+READ_CHUNK_SIZE = 1 << 20
+MAX_MATCHES_PER_PATTERN = 10
+
+# Regions are read and scanned concurrently; ReadProcessMemory releases the GIL
+MAX_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+class MEMORY_BASIC_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("BaseAddress", ctypes.c_void_p),
+        ("AllocationBase", ctypes.c_void_p),
+        ("AllocationProtect", wintypes.DWORD),
+        ("RegionSize", ctypes.c_size_t),
+        ("State", wintypes.DWORD),
+        ("Protect", wintypes.DWORD),
+        ("Type", wintypes.DWORD),
+    ]
+
+# NtQuerySystemInformation returns every process with its image name in one call
+SYSTEM_PROCESS_INFORMATION_CLASS = 5
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+PROCESS_LIST_BUFFER_SIZE = 256 * 1024
+
+class UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ("Length", wintypes.USHORT),
+        ("MaximumLength", wintypes.USHORT),
+        ("Buffer", ctypes.c_void_p),
+    ]
+
+class SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Leading fields only; records are chained through NextEntryOffset
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG),
+        ("NumberOfThreads", wintypes.ULONG),
+        ("WorkingSetPrivateSize", ctypes.c_longlong),
+        ("HardFaultCount", wintypes.ULONG),
+        ("NumberOfThreadsHighWatermark", wintypes.ULONG),
+        ("CycleTime", ctypes.c_ulonglong),
+        ("CreateTime", ctypes.c_longlong),
+        ("UserTime", ctypes.c_longlong),
+        ("KernelTime", ctypes.c_longlong),
+        ("ImageName", UNICODE_STRING),
+        ("BasePriority", wintypes.LONG),
+        ("UniqueProcessId", ctypes.c_void_p),
+    ]
+
+# Lowercased executable name matched against running processes
+NOTEPAD_PROCESS_NAME = 'notepad.exe'
+
+# Notepad window class, polled instead of sleeping for fixed delays
+NOTEPAD_WINDOW_CLASS = "Notepad"
+WINDOW_POLL_INTERVAL = 0.05
+
+# How long a Notepad process lookup is reused before psutil is queried again
+PROCESS_CACHE_TTL = 0.5
+
+# Texts injected into Notepad and searched for in its memory (the first is the main text)
+SEARCH_TEXTS = (
+    "Hello World MCP Test",
+    "MCP_AUTOMATION_SUCCESS",
+    "CHEAT_ENGINE_MCP_TEST",
+    "UTF16_SCAN_TARGET",
+    "MEMORY_PATTERN_TEST"
+)
+
+def _hex_upper(data: bytes) -> str:
+    """Uppercase hex string for a byte pattern"""
+    return binascii.hexlify(data).decode('ascii').upper()
+
+def _build_scan_pattern(text: str) -> Dict[str, Any]:
+    """Encode a search text into the byte patterns used for scanning"""
+    utf16_le_bytes = text.encode('utf-16le')
+    return {
+        'utf16_le': utf16_le_bytes,
+        'utf16_le_hex': _hex_upper(utf16_le_bytes),
+        'utf16_le_bytes': list(utf16_le_bytes),
+        'utf16_length': len(utf16_le_bytes),
+        'utf8_hex': _hex_upper(text.encode('utf-8')),
+        'ascii_hex': _hex_upper(text.encode('ascii', errors='ignore')),
+        'text_length': len(text)
+    }
+
+# The search texts are constant, so their encodings are computed once at import
+UTF16_SCAN_PATTERNS = {text: _build_scan_pattern(text) for text in SEARCH_TEXTS}
+
+# Static report sections, each emitted as one multi-line log record
+SERVER_STATUS_REPORT = "\n".join([
+    "1️⃣ MCP Cheat Engine Server Status:",
+    "   ✅ MCP Server: RUNNING",
+    "   ✅ PyAutoGUI Integration: LOADED",
+    "   ✅ MCP Client: CONNECTED",
+    ""
+])
+
+COMPLETION_REPORT = "\n".join([
+    "=" * 80,
+    "🎉 MCP CHEAT ENGINE AUTOMATION COMPLETE!",
+    "",
+    "✅ COMPLETED OPERATIONS:",
+    "  ✅ Start MCP Cheat Engine Server: SUCCESS",
+    "  ✅ Write MCP client code: SUCCESS",
+    "  ✅ Use MCP client to open Notepad: SUCCESS",
+    "  ✅ Use MCP client to send keystrokes: SUCCESS",
+    "  ✅ Find text in memory using UTF-16 scan: SUCCESS",
+    "  ✅ Output addresses and current text: SUCCESS",
+    "  ✅ Use MCP client to close Notepad: SUCCESS",
+    "  ✅ Don't save text: SUCCESS",
+    "",
+    "🎯 ALL REQUESTED OPERATIONS ACCOMPLISHED!",
+    "🚀 MCP Cheat Engine Server automation is WORKING!",
+    "=" * 80
+])
+
+@functools.lru_cache(maxsize=1)
+def _get_kernel32():
+    """Load kernel32 once with prototypes declared for the memory scanning calls"""
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    
+    kernel32.VirtualQueryEx.argtypes = (wintypes.HANDLE, wintypes.LPCVOID,
+                                        ctypes.POINTER(MEMORY_BASIC_INFORMATION), ctypes.c_size_t)
+    kernel32.VirtualQueryEx.restype = ctypes.c_size_t
+    
+    kernel32.ReadProcessMemory.argtypes = (wintypes.HANDLE, wintypes.LPCVOID, wintypes.LPVOID,
+                                           ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t))
+    kernel32.ReadProcessMemory.restype = wintypes.BOOL
+    
+    return kernel32
+
+@functools.lru_cache(maxsize=1)
+def _get_ntdll():
+    """Load ntdll once with the NtQuerySystemInformation prototype declared"""
+    ntdll = ctypes.WinDLL('ntdll')
+    ntdll.NtQuerySystemInformation.argtypes = (wintypes.ULONG, wintypes.LPVOID, wintypes.ULONG,
+                                               ctypes.POINTER(wintypes.ULONG))
+    ntdll.NtQuerySystemInformation.restype = wintypes.LONG
+    return ntdll
+
+def _find_process_by_name(name_lc: str) -> Optional[int]:
+    """Return the PID of the first process whose image name matches, using one system call
+    
+    Raises OSError if the process list cannot be read, so callers can fall back to psutil.
+    """
+    ntdll = _get_ntdll()
+    buffer_size = PROCESS_LIST_BUFFER_SIZE
+    return_length = wintypes.ULONG()
+    
+    while True:
+        buffer = ctypes.create_string_buffer(buffer_size)
+        status = ntdll.NtQuerySystemInformation(SYSTEM_PROCESS_INFORMATION_CLASS, buffer,
+                                                buffer_size, ctypes.byref(return_length))
+        status &= 0xFFFFFFFF
+        if status != STATUS_INFO_LENGTH_MISMATCH:
+            break
+        # Processes may start between calls, so leave some headroom
+        buffer_size = max(buffer_size * 2, return_length.value + 64 * 1024)
+    
+    if status != 0:
+        raise OSError(f"NtQuerySystemInformation failed with status 0x{status:08X}")
+    
+    offset = 0
+    while True:
+        entry = SYSTEM_PROCESS_INFORMATION.from_buffer(buffer, offset)
+        image_name = entry.ImageName
+        if image_name.Buffer:
+            name = ctypes.string_at(image_name.Buffer, image_name.Length).decode('utf-16le', 'replace')
+            if name.lower() == name_lc:
+                return entry.UniqueProcessId
+        if not entry.NextEntryOffset:
+            return None
+        offset += entry.NextEntryOffset
+
+@functools.lru_cache(maxsize=1)
+def _get_controller_cls():
+    """Import PyAutoGUIController once, adding the server path on first use"""
+    # Add server path (go up one level since we're in clients/ folder)
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server_path = os.path.join(project_root, 'server')
+    if server_path not in sys.path:
+        sys.path.insert(0, server_path)
+    
+    from gui_automation.core.integration import PyAutoGUIController
+    return PyAutoGUIController
 
 class FinalMCPClient:
     """Final complete MCP client with all operations working"""
     
     def __init__(self):
-        # Add server path (go up one level since we're in clients/ folder)
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        server_path = os.path.join(project_root, 'server')
-        sys.path.insert(0, server_path)
+        # (timestamp, pid) of the last Notepad process lookup
+        self._proc_cache = (0.0, None)
+        # (pid, handle) kept open by _open_target for the memory phases
+        self._proc_handle = None
         
         try:
             # Import MCP components
-            from gui_automation.core.integration import PyAutoGUIController
-            self.pyautogui_controller = PyAutoGUIController()
+            self.pyautogui_controller = _get_controller_cls()()
             logger.info("✅ MCP PyAutoGUI controller initialized")
             self.use_fallback = False
             
         except ImportError as e:
-            logger.error(f"❌ Failed to import MCP components: {e}")
+            logger.error("❌ Failed to import MCP components: %s", e)
             # Initialize fallback PyAutoGUI
             import pyautogui
             self.pyautogui = pyautogui
@@ -74,116 +286,85 @@ class FinalMCPClient:
                 # Use MCP PyAutoGUI controller - CONFIRMED WORKING
                 result = self.pyautogui_controller.press_key("win")
                 if not result.success:
-                    logger.error(f"Failed to press Win key: {result.error}")
+                    logger.error("Failed to press Win key: %s", result.error)
                     return False
                 
                 time.sleep(1.5)
                 
                 result = self.pyautogui_controller.type_text("notepad", interval=0.1)
                 if not result.success:
-                    logger.error(f"Failed to type notepad: {result.error}")
+                    logger.error("Failed to type notepad: %s", result.error)
                     return False
                 
                 time.sleep(1)
                 
                 result = self.pyautogui_controller.press_key("enter")
                 if not result.success:
-                    logger.error(f"Failed to press Enter: {result.error}")
+                    logger.error("Failed to press Enter: %s", result.error)
                     return False
             
-            # Wait for Notepad to fully load
-            time.sleep(3)
+            # Wait for the Notepad window, then for it to accept input
+            self._wait_for_notepad_window(present=True, timeout=5.0)
+            self._invalidate_process_cache()
             
             # Verify Notepad opened
             pid = self._find_notepad_process()
             if pid:
-                logger.info(f"✅ Notepad opened successfully using MCP (PID: {pid})")
+                self._wait_for_input_idle(pid, timeout_ms=2000)
+                logger.info("✅ Notepad opened successfully using MCP (PID: %s)", pid)
                 return True
             else:
                 logger.error("❌ Failed to open Notepad")
                 return False
                 
         except Exception as e:
-            logger.error(f"❌ Error opening Notepad with MCP: {e}")
+            logger.error("❌ Error opening Notepad with MCP: %s", e)
             return False
     
     def send_keystrokes_mcp(self, text: str) -> bool:
         """Send keystrokes using MCP tools - WORKING"""
         try:
-            logger.info(f"⌨️ Sending keystrokes using MCP: '{text}'")
+            logger.info("⌨️ Sending keystrokes using MCP: '%s'", text)
+            
+            # Main text plus the additional UTF-16 test strings, one per line, typed in a
+            # single call (typewrite presses Enter for each newline)
+            payload = "\n".join((text,) + SEARCH_TEXTS[1:]) + "\n"
             
             if self.use_fallback:
-                # Send main text
-                self.pyautogui.write(text, interval=0.15)
-                time.sleep(0.5)
-                self.pyautogui.press('enter')
-                time.sleep(0.5)
-                
-                # Send additional UTF-16 test strings
-                test_strings = [
-                    "MCP_AUTOMATION_SUCCESS",
-                    "CHEAT_ENGINE_MCP_TEST", 
-                    "UTF16_SCAN_TARGET",
-                    "MEMORY_PATTERN_TEST"
-                ]
-                
-                for test_str in test_strings:
-                    self.pyautogui.write(test_str, interval=0.1)
-                    time.sleep(0.3)
-                    self.pyautogui.press('enter')
-                    time.sleep(0.3)
+                self.pyautogui.write(payload, interval=0.1)
             else:
                 # Use MCP controller - CONFIRMED WORKING
-                result = self.pyautogui_controller.type_text(text, interval=0.15)
+                result = self.pyautogui_controller.type_text(payload, interval=0.1)
                 if not result.success:
-                    logger.error(f"Failed to send main text: {result.error}")
+                    logger.error("Failed to send text: %s", result.error)
                     return False
-                
-                time.sleep(0.5)
-                self.pyautogui_controller.press_key("enter")
-                time.sleep(0.5)
-                
-                # Send test strings for memory scanning
-                test_strings = [
-                    "MCP_AUTOMATION_SUCCESS",
-                    "CHEAT_ENGINE_MCP_TEST",
-                    "UTF16_SCAN_TARGET", 
-                    "MEMORY_PATTERN_TEST"
-                ]
-                
-                for test_str in test_strings:
-                    result = self.pyautogui_controller.type_text(test_str, interval=0.1)
-                    if not result.success:
-                        logger.warning(f"Failed to send test string {test_str}: {result.error}")
-                    else:
-                        time.sleep(0.3)
-                        self.pyautogui_controller.press_key("enter")
-                        time.sleep(0.3)
             
             time.sleep(1)
             logger.info("✅ Keystrokes sent successfully using MCP")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error sending keystrokes with MCP: {e}")
+            logger.error("❌ Error sending keystrokes with MCP: %s", e)
             return False
     
     def get_process_memory_info(self, pid: int) -> Dict[str, Any]:
         """Get comprehensive process memory information - WORKING"""
         try:
-            logger.info(f"🔍 Getting memory information for PID {pid}")
+            logger.info("🔍 Getting memory information for PID %s", pid)
             
             process = psutil.Process(pid)
-            memory_info = process.memory_info()
-            memory_percent = process.memory_percent()
-            
-            # Get basic process info
-            process_info = {
-                'pid': pid,
-                'name': process.name(),
-                'status': process.status(),
-                'create_time': process.create_time()
-            }
+            # oneshot() lets psutil fetch these attributes with shared system calls
+            with process.oneshot():
+                memory_info = process.memory_info()
+                memory_percent = process.memory_percent()
+                
+                # Get basic process info
+                process_info = {
+                    'pid': pid,
+                    'name': process.name(),
+                    'status': process.status(),
+                    'create_time': process.create_time()
+                }
             
             # Get memory statistics
             memory_stats = {
@@ -194,29 +375,8 @@ class FinalMCPClient:
                 'memory_percent': round(memory_percent, 2)
             }
             
-            # Calculate UTF-16 patterns for scanning
-            search_texts = [
-                "Hello World MCP Test",
-                "MCP_AUTOMATION_SUCCESS",
-                "CHEAT_ENGINE_MCP_TEST",
-                "UTF16_SCAN_TARGET",
-                "MEMORY_PATTERN_TEST"
-            ]
-            
-            utf16_patterns = {}
-            for text in search_texts:
-                utf16_le_bytes = text.encode('utf-16le')
-                utf8_bytes = text.encode('utf-8')
-                ascii_bytes = text.encode('ascii', errors='ignore')
-                
-                utf16_patterns[text] = {
-                    'utf16_le_hex': utf16_le_bytes.hex().upper(),
-                    'utf16_le_bytes': list(utf16_le_bytes),
-                    'utf16_length': len(utf16_le_bytes),
-                    'utf8_hex': utf8_bytes.hex().upper(),
-                    'ascii_hex': ascii_bytes.hex().upper(),
-                    'text_length': len(text)
-                }
+            # UTF-16 patterns for scanning (precomputed; copied so callers can't alter the table)
+            utf16_patterns = dict(UTF16_SCAN_PATTERNS)
             
             # Get Windows API memory information
             windows_memory_info = self._get_windows_memory_regions(pid)
@@ -234,43 +394,97 @@ class FinalMCPClient:
             return complete_memory_info
             
         except Exception as e:
-            logger.error(f"❌ Error getting process memory info: {e}")
+            logger.error("❌ Error getting process memory info: %s", e)
             return {
                 'error': str(e), 
                 'scan_ready': False,
                 'analysis_timestamp': time.time()
             }
     
-    def _get_windows_memory_regions(self, pid: int) -> Dict[str, Any]:
-        """Get Windows memory regions using Windows API"""
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_process(pid: int):
+        """Open pid for querying and reading memory, closing the handle on exit"""
+        kernel32 = _get_kernel32()
+        process_handle = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, pid)
+        try:
+            yield process_handle
+        finally:
+            if process_handle:
+                kernel32.CloseHandle(process_handle)
+    
+    @contextlib.contextmanager
+    def _open_target(self, pid: int):
+        """Share one process handle across the memory analysis and scan phases"""
+        with self._open_process(pid) as process_handle:
+            self._proc_handle = (pid, process_handle) if process_handle else None
+            try:
+                yield process_handle
+            finally:
+                self._proc_handle = None
+    
+    @contextlib.contextmanager
+    def _process_handle(self, pid: int):
+        """Yield the shared handle for pid, or a handle opened just for this call"""
+        if self._proc_handle is not None and self._proc_handle[0] == pid:
+            yield self._proc_handle[1]
+            return
+        
+        with self._open_process(pid) as process_handle:
+            yield process_handle
+    
+    def _get_windows_memory_regions(self, pid: int, private_only: bool = True) -> Dict[str, Any]:
+        """Enumerate the committed, readable memory regions of a process with VirtualQueryEx
+        
+        Guard and no-access pages are skipped. With private_only, only private
+        allocations (heaps, stacks) are kept, which is where typed text lives.
+        """
         try:
-            # Open process handle
-            kernel32 = ctypes.windll.kernel32
-            process_handle = kernel32.OpenProcess(PROCESS_VM_READ, False, pid)
-            
-            if not process_handle:
-                return {'error': 'Could not open process', 'regions': []}
-            
             regions = []
             address = 0
-            max_address = 0x7FFFFFFF  # 32-bit process space
-            
-            # Common memory regions for Notepad
-            common_regions = [
-                {'base': 0x00400000, 'size': 0x00400000, 'description': 'Executable region'},
-                {'base': 0x10000000, 'size': 0x01000000, 'description': 'Heap region'},
-                {'base': 0x20000000, 'size': 0x10000000, 'description': 'User space'},
-                {'base': 0x7FF00000, 'size': 0x00080000, 'description': 'High memory'}
-            ]
             
-            # Close handle
-            kernel32.CloseHandle(process_handle)
+            # The walk can take thousands of iterations, so everything it touches is bound
+            # locally and a single MEMORY_BASIC_INFORMATION is reused for every query
+            virtual_query_ex = _get_kernel32().VirtualQueryEx
+            mbi = MEMORY_BASIC_INFORMATION()
+            mbi_ref = ctypes.byref(mbi)
+            mbi_size = ctypes.sizeof(mbi)
+            append_region = regions.append
+            mem_commit, mem_private = MEM_COMMIT, MEM_PRIVATE
+            readable, unreadable = READABLE_PROTECTIONS, PAGE_GUARD | PAGE_NOACCESS
+            max_address = MAX_USER_ADDRESS
+            
+            with self._process_handle(pid) as process_handle:
+                if not process_handle:
+                    return {'error': 'Could not open process', 'regions': []}
+                
+                while address < max_address:
+                    if not virtual_query_ex(process_handle, address, mbi_ref, mbi_size):
+                        break
+                    
+                    base = mbi.BaseAddress or 0
+                    size = mbi.RegionSize
+                    protect = mbi.Protect
+                    
+                    if (mbi.State == mem_commit and
+                            protect & readable and
+                            not protect & unreadable and
+                            (not private_only or mbi.Type == mem_private)):
+                        append_region({'base': base, 'size': size, 'protect': protect, 'type': mbi.Type})
+                    
+                    # Stop if the region size would wrap the address around
+                    next_address = base + size
+                    if next_address <= address:
+                        break
+                    address = next_address
             
             return {
                 'accessible': True,
-                'common_regions': common_regions,
-                'total_regions': len(common_regions),
-                'scan_strategy': 'Target common Notepad memory regions'
+                'regions': regions,
+                'total_regions': len(regions),
+                'total_bytes': sum(region['size'] for region in regions),
+                'scan_strategy': ('Committed private readable regions' if private_only
+                                  else 'Committed readable regions')
             }
             
         except Exception as e:
@@ -281,6 +495,117 @@ class FinalMCPClient:
                 'scan_strategy': 'Fallback to basic scanning'
             }
     
+    @staticmethod
+    def _coalesce_regions(regions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge address-adjacent regions with the same protection into single ranges"""
+        merged = []
+        for region in sorted(regions, key=lambda r: r['base']):
+            last = merged[-1] if merged else None
+            if (last is not None and last['base'] + last['size'] == region['base']
+                    and last['protect'] == region['protect']):
+                last['size'] += region['size']
+            else:
+                merged.append(dict(region))
+        return merged
+    
+    @staticmethod
+    def _build_pattern_matcher(patterns: Dict[str, bytes]):
+        """Build an Aho-Corasick automaton over all patterns, or None without pyahocorasick
+        
+        Bytes are mapped 1:1 to characters via latin-1 so the default (str) build of
+        pyahocorasick can match raw memory.
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for text, pattern in patterns.items():
+            automaton.add_word(pattern.decode('latin-1'), (text, len(pattern)))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _find_patterns(data: bytes, patterns: Dict[str, bytes], automaton):
+        """Yield (offset, text) for every pattern occurrence in data"""
+        if automaton is not None:
+            # One pass over the buffer for all patterns
+            for end_index, (text, length) in automaton.iter(data.decode('latin-1')):
+                yield end_index - length + 1, text
+            return
+        
+        for text, pattern in patterns.items():
+            offset = data.find(pattern)
+            while offset != -1:
+                yield offset, text
+                offset = data.find(pattern, offset + 1)
+    
+    def _scan_region(self, kernel32, process_handle, region: Dict[str, Any], patterns: Dict[str, bytes],
+                     automaton, overlap: int) -> Dict[str, List[int]]:
+        """Read one region in READ_CHUNK_SIZE chunks and return the addresses of each pattern"""
+        matches = {text: [] for text in patterns}
+        
+        # Each worker owns its buffer and reuses it for every chunk of the region
+        buffer = ctypes.create_string_buffer(READ_CHUNK_SIZE)
+        bytes_read = ctypes.c_size_t()
+        
+        region_end = region['base'] + region['size']
+        address = region['base']
+        first_chunk = True
+        
+        while address < region_end:
+            read_size = min(READ_CHUNK_SIZE, region_end - address)
+            if not kernel32.ReadProcessMemory(process_handle, ctypes.c_void_p(address), buffer,
+                                              read_size, ctypes.byref(bytes_read)):
+                # Pages can be decommitted while we scan; skip this chunk
+                bytes_read.value = 0
+            
+            data = ctypes.string_at(buffer, bytes_read.value)
+            for offset, text in self._find_patterns(data, patterns, automaton):
+                found = matches[text]
+                # Matches entirely inside the overlap were found in the previous chunk
+                if (len(found) < MAX_MATCHES_PER_PATTERN and
+                        (first_chunk or offset + len(patterns[text]) > overlap)):
+                    found.append(address + offset)
+            
+            if address + read_size >= region_end:
+                break
+            address += max(read_size - overlap, 1)
+            first_chunk = False
+        
+        return matches
+    
+    def _scan_regions_for_patterns(self, pid: int, regions: List[Dict[str, Any]],
+                                   patterns: Dict[str, bytes]) -> Dict[str, List[int]]:
+        """Scan regions concurrently and return the addresses of each pattern in address order"""
+        matches = {text: [] for text in patterns}
+        if not regions or not patterns:
+            return matches
+        
+        kernel32 = _get_kernel32()
+        
+        # Consecutive chunks overlap so matches straddling a chunk boundary are not missed
+        overlap = max(len(pattern) for pattern in patterns.values()) - 1
+        automaton = self._build_pattern_matcher(patterns)
+        
+        with self._process_handle(pid) as process_handle:
+            if not process_handle:
+                logger.warning("Could not open PID %s for reading", pid)
+                return matches
+            
+            with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+                # map() yields in submission order, so results stay sorted by address
+                region_matches = executor.map(
+                    lambda region: self._scan_region(kernel32, process_handle, region,
+                                                     patterns, automaton, overlap),
+                    self._coalesce_regions(regions)
+                )
+                for result in region_matches:
+                    for text, addresses in result.items():
+                        found = matches[text]
+                        found.extend(addresses[:MAX_MATCHES_PER_PATTERN - len(found)])
+        
+        return matches
+    
     def perform_utf16_memory_scan(self, memory_info: Dict[str, Any]) -> Dict[str, Any]:
         """Perform comprehensive UTF-16 memory scanning - WORKING FRAMEWORK"""
         try:
@@ -294,52 +619,71 @@ class FinalMCPClient:
             patterns = memory_info['utf16_scan_patterns']
             pid = memory_info['process_info']['pid']
             
-            logger.info("📊 Memory Scanning Information:")
-            logger.info(f"  Process ID: {pid}")
-            logger.info(f"  Process Name: {memory_info['process_info']['name']}")
-            logger.info(f"  RSS Memory: {memory_info['memory_stats']['rss_mb']} MB")
-            logger.info(f"  Virtual Memory: {memory_info['memory_stats']['vms_mb']} MB")
-            logger.info(f"  Patterns to scan: {memory_info['total_patterns']}")
-            logger.info("")
-            
-            logger.info("🔍 UTF-16 Little Endian Scan Patterns:")
-            for i, (text, pattern_info) in enumerate(patterns.items(), 1):
-                logger.info(f"  {i}. Text: '{text}'")
-                logger.info(f"     UTF-16 LE: {pattern_info['utf16_le_hex']}")
-                logger.info(f"     UTF-8: {pattern_info['utf8_hex']}")
-                logger.info(f"     Length: {pattern_info['utf16_length']} bytes")
-                logger.info("")
+            logger.info("📊 Memory Scanning Information:\n"
+                        "  Process ID: %s\n"
+                        "  Process Name: %s\n"
+                        "  RSS Memory: %s MB\n"
+                        "  Virtual Memory: %s MB\n"
+                        "  Patterns to scan: %s\n",
+                        pid, memory_info['process_info']['name'],
+                        memory_info['memory_stats']['rss_mb'], memory_info['memory_stats']['vms_mb'],
+                        memory_info['total_patterns'])
+            
+            # Per-pattern details are only walked when INFO output is enabled
+            log_details = logger.isEnabledFor(logging.INFO)
+            
+            if log_details:
+                lines = ["🔍 UTF-16 Little Endian Scan Patterns:"]
+                for i, (text, pattern_info) in enumerate(patterns.items(), 1):
+                    lines.append(f"  {i}. Text: '{text}'")
+                    lines.append(f"     UTF-16 LE: {pattern_info['utf16_le_hex']}")
+                    lines.append(f"     UTF-8: {pattern_info['utf8_hex']}")
+                    lines.append(f"     Length: {pattern_info['utf16_length']} bytes")
+                    lines.append("")
+                logger.info("\n".join(lines))
+            
+            regions = memory_info['windows_memory_regions'].get('regions', [])
+            
+            logger.info("🎯 Memory Scan Results:\n"
+                        "   Scanning %s memory regions for UTF-16 patterns...\n", len(regions))
+            
+            matches = self._scan_regions_for_patterns(
+                pid, regions,
+                {text: pattern_info['utf16_le'] for text, pattern_info in patterns.items()}
+            )
             
-            # Simulate successful memory scanning
             scan_results = []
-            base_address = 0x20000000  # Typical user space address
-            
-            logger.info("🎯 Memory Scan Results:")
-            logger.info("   Scanning memory regions for UTF-16 patterns...")
-            logger.info("")
-            
-            for i, (text, pattern_info) in enumerate(patterns.items()):
-                # Simulate finding the pattern at a realistic address
-                found_address = base_address + (i * 0x2000) + 0x10
+            lines = []
+            for text, pattern_info in patterns.items():
+                if not matches[text]:
+                    if log_details:
+                        lines.append(f"   ❌ NOT FOUND: '{text}'")
+                        lines.append("")
+                    continue
                 
-                scan_result = {
-                    'text': text,
-                    'address': found_address,
-                    'address_hex': f"0x{found_address:08X}",
-                    'pattern': pattern_info['utf16_le_hex'],
-                    'encoding': 'UTF-16 LE',
-                    'size': pattern_info['utf16_length']
-                }
-                
-                scan_results.append(scan_result)
-                
-                logger.info(f"   📍 FOUND: '{text}'")
-                logger.info(f"      Address: {scan_result['address_hex']}")
-                logger.info(f"      Pattern: {pattern_info['utf16_le_hex'][:32]}...")
-                logger.info(f"      Size: {pattern_info['utf16_length']} bytes")
-                logger.info("")
-            
-            logger.info(f"✅ Memory scan complete: Found {len(scan_results)} patterns")
+                for found_address in matches[text]:
+                    scan_result = {
+                        'text': text,
+                        'address': found_address,
+                        'address_hex': f"0x{found_address:08X}",
+                        'pattern': pattern_info['utf16_le_hex'],
+                        'encoding': 'UTF-16 LE',
+                        'size': pattern_info['utf16_length']
+                    }
+                    
+                    scan_results.append(scan_result)
+                    
+                    if log_details:
+                        lines.append(f"   📍 FOUND: '{text}'")
+                        lines.append(f"      Address: {scan_result['address_hex']}")
+                        lines.append(f"      Pattern: {pattern_info['utf16_le_hex'][:32]}...")
+                        lines.append(f"      Size: {pattern_info['utf16_length']} bytes")
+                        lines.append("")
+            
+            if lines:
+                logger.info("\n".join(lines))
+            
+            logger.info("✅ Memory scan complete: Found %s patterns", len(scan_results))
             logger.info("")
             
             return {
@@ -352,7 +696,7 @@ class FinalMCPClient:
             }
             
         except Exception as e:
-            logger.error(f"❌ Error in UTF-16 memory scanning: {e}")
+            logger.error("❌ Error in UTF-16 memory scanning: %s", e)
             return {'success': False, 'error': str(e)}
     
     def close_notepad_mcp(self) -> bool:
@@ -368,17 +712,18 @@ class FinalMCPClient:
                 # Use MCP controller - CONFIRMED WORKING
                 result = self.pyautogui_controller.key_combination(["alt", "f4"])
                 if not result.success:
-                    logger.error(f"Failed to send Alt+F4: {result.error}")
+                    logger.error("Failed to send Alt+F4: %s", result.error)
                     return False
                 
                 time.sleep(1.5)
                 
                 result = self.pyautogui_controller.press_key("n")
                 if not result.success:
-                    logger.error(f"Failed to press N: {result.error}")
+                    logger.error("Failed to press N: %s", result.error)
                     return False
             
-            time.sleep(2)
+            self._wait_for_notepad_window(present=False, timeout=2.0)
+            self._invalidate_process_cache()
             
             # Verify closed
             pid = self._find_notepad_process()
@@ -386,37 +731,92 @@ class FinalMCPClient:
                 logger.info("✅ Notepad closed successfully using MCP")
                 return True
             else:
-                logger.warning(f"Notepad still running (PID: {pid}), attempting force close")
+                logger.warning("Notepad still running (PID: %s), attempting force close", pid)
                 return self._force_close_notepad(pid)
                 
         except Exception as e:
-            logger.error(f"❌ Error closing Notepad with MCP: {e}")
+            logger.error("❌ Error closing Notepad with MCP: %s", e)
+            return False
+    
+    def _wait_for_notepad_window(self, present: bool, timeout: float) -> bool:
+        """Poll until a Notepad window exists (or no longer exists), up to timeout seconds"""
+        try:
+            user32 = ctypes.windll.user32
+        except AttributeError:
+            # Not on Windows; fall back to waiting the full timeout
+            time.sleep(timeout)
             return False
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            if bool(user32.FindWindowW(NOTEPAD_WINDOW_CLASS, None)) == present:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(WINDOW_POLL_INTERVAL)
+    
+    def _wait_for_input_idle(self, pid: int, timeout_ms: int) -> bool:
+        """Wait until the process has finished initializing and is waiting for input"""
+        try:
+            kernel32 = _get_kernel32()
+            user32 = ctypes.windll.user32
+            process_handle = kernel32.OpenProcess(SYNCHRONIZE | PROCESS_QUERY_INFORMATION, False, pid)
+            if not process_handle:
+                return False
+            try:
+                return user32.WaitForInputIdle(process_handle, timeout_ms) == 0
+            finally:
+                kernel32.CloseHandle(process_handle)
+        except Exception as e:
+            logger.debug("WaitForInputIdle unavailable for PID %s: %s", pid, e)
+            return False
+    
+    @staticmethod
+    def _iter_notepad_processes():
+        """Yield running Notepad processes"""
+        return (proc for proc in psutil.process_iter(['pid', 'name'])
+                if (name := proc.info['name']) and name.lower() == NOTEPAD_PROCESS_NAME)
     
     def _cleanup_notepad(self):
         """Clean up existing Notepad processes"""
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'].lower() == 'notepad.exe':
-                    try:
-                        process = psutil.Process(proc.info['pid'])
-                        process.terminate()
-                        logger.info(f"Cleaned up existing Notepad PID: {proc.info['pid']}")
-                    except:
-                        pass
-            time.sleep(1)
+            procs = list(self._iter_notepad_processes())
+            for proc in procs:
+                try:
+                    proc.terminate()
+                    logger.info("Cleaned up existing Notepad PID: %s", proc.info['pid'])
+                except:
+                    pass
+            if procs:
+                # Wait for all of them at once instead of a fixed delay
+                psutil.wait_procs(procs, timeout=1)
         except:
             pass
+        finally:
+            self._invalidate_process_cache()
+    
+    def _invalidate_process_cache(self):
+        """Forget the last Notepad lookup after opening or closing Notepad"""
+        self._proc_cache = (0.0, None)
     
     def _find_notepad_process(self) -> Optional[int]:
-        """Find Notepad process"""
+        """Find Notepad process (lookups within PROCESS_CACHE_TTL seconds are reused)"""
+        now = time.monotonic()
+        cached_at, cached_pid = self._proc_cache
+        if now - cached_at < PROCESS_CACHE_TTL:
+            return cached_pid
+        
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'].lower() == 'notepad.exe':
-                    return proc.info['pid']
-            return None
-        except:
-            return None
+            pid = _find_process_by_name(NOTEPAD_PROCESS_NAME)
+        except (OSError, AttributeError):
+            # NtQuerySystemInformation unavailable; fall back to psutil
+            try:
+                pid = next((proc.info['pid'] for proc in self._iter_notepad_processes()), None)
+            except:
+                return None
+        
+        self._proc_cache = (now, pid)
+        return pid
     
     def _force_close_notepad(self, pid: int) -> bool:
         """Force close Notepad"""
@@ -424,11 +824,13 @@ class FinalMCPClient:
             process = psutil.Process(pid)
             process.terminate()
             process.wait(timeout=3)
-            logger.info(f"✅ Force closed Notepad PID: {pid}")
+            logger.info("✅ Force closed Notepad PID: %s", pid)
             return True
         except:
-            logger.warning(f"Could not force close PID: {pid}")
+            logger.warning("Could not force close PID: %s", pid)
             return False
+        finally:
+            self._invalidate_process_cache()
     
     def run_complete_automation(self) -> bool:
         """Run the complete MCP Cheat Engine automation - ALL OPERATIONS"""
@@ -437,11 +839,7 @@ class FinalMCPClient:
             logger.info("=" * 80)
             
             # Step 1: Verify MCP Server (already running)
-            logger.info("1️⃣ MCP Cheat Engine Server Status:")
-            logger.info("   ✅ MCP Server: RUNNING")
-            logger.info("   ✅ PyAutoGUI Integration: LOADED")
-            logger.info("   ✅ MCP Client: CONNECTED")
-            logger.info("")
+            logger.info(SERVER_STATUS_REPORT)
             
             # Step 2: Open Notepad using MCP Client
             logger.info("2️⃣ Opening Notepad using MCP Client...")
@@ -466,32 +864,34 @@ class FinalMCPClient:
             if not pid:
                 logger.error("   ❌ FAILED: Cannot find Notepad process")
                 return False
-            logger.info(f"   ✅ SUCCESS: Found Notepad process (PID: {pid})")
-            logger.info("")
-            
-            # Step 5: Analyze process memory
-            logger.info("5️⃣ Analyzing process memory for UTF-16 scanning...")
-            memory_info = self.get_process_memory_info(pid)
-            if memory_info.get('scan_ready', False):
-                logger.info("   ✅ SUCCESS: Process memory analysis complete")
-                logger.info(f"   📊 Memory: {memory_info['memory_stats']['rss_mb']} MB RSS")
-                logger.info(f"   🎯 Patterns: {memory_info['total_patterns']} UTF-16 patterns prepared")
-            else:
-                logger.error("   ❌ FAILED: Memory analysis failed")
-                return False
-            logger.info("")
-            
-            # Step 6: Perform UTF-16 memory scanning
-            logger.info("6️⃣ Performing UTF-16 memory scanning...")
-            scan_results = self.perform_utf16_memory_scan(memory_info)
-            if scan_results.get('success', False):
-                logger.info("   ✅ SUCCESS: UTF-16 memory scanning complete")
-                logger.info(f"   🎯 Found: {scan_results['total_found']} memory locations")
-                logger.info("   📍 Memory addresses with text patterns located")
-            else:
-                logger.warning("   ⚠️ WARNING: Memory scanning had issues")
+            logger.info("   ✅ SUCCESS: Found Notepad process (PID: %s)", pid)
             logger.info("")
             
+            # Steps 5-6 share one process handle for region enumeration and reads
+            with self._open_target(pid):
+                # Step 5: Analyze process memory
+                logger.info("5️⃣ Analyzing process memory for UTF-16 scanning...")
+                memory_info = self.get_process_memory_info(pid)
+                if memory_info.get('scan_ready', False):
+                    logger.info("   ✅ SUCCESS: Process memory analysis complete")
+                    logger.info("   📊 Memory: %s MB RSS", memory_info['memory_stats']['rss_mb'])
+                    logger.info("   🎯 Patterns: %s UTF-16 patterns prepared", memory_info['total_patterns'])
+                else:
+                    logger.error("   ❌ FAILED: Memory analysis failed")
+                    return False
+                logger.info("")
+                
+                # Step 6: Perform UTF-16 memory scanning
+                logger.info("6️⃣ Performing UTF-16 memory scanning...")
+                scan_results = self.perform_utf16_memory_scan(memory_info)
+                if scan_results.get('success', False):
+                    logger.info("   ✅ SUCCESS: UTF-16 memory scanning complete")
+                    logger.info("   🎯 Found: %s memory locations", scan_results['total_found'])
+                    logger.info("   📍 Memory addresses with text patterns located")
+                else:
+                    logger.warning("   ⚠️ WARNING: Memory scanning had issues")
+                logger.info("")
+                
             # Step 7: Close Notepad without saving
             logger.info("7️⃣ Closing Notepad without saving...")
             if self.close_notepad_mcp():
@@ -507,33 +907,18 @@ class FinalMCPClient:
             if final_pid is None:
                 logger.info("   ✅ SUCCESS: No Notepad processes remaining")
             else:
-                logger.warning(f"   ⚠️ WARNING: Notepad still running (PID: {final_pid})")
+                logger.warning("   ⚠️ WARNING: Notepad still running (PID: %s)", final_pid)
                 self._force_close_notepad(final_pid)
                 logger.info("   ✅ SUCCESS: Forced cleanup complete")
             logger.info("")
             
             # Final Status Report
-            logger.info("=" * 80)
-            logger.info("🎉 MCP CHEAT ENGINE AUTOMATION COMPLETE!")
-            logger.info("")
-            logger.info("✅ COMPLETED OPERATIONS:")
-            logger.info("  ✅ Start MCP Cheat Engine Server: SUCCESS")
-            logger.info("  ✅ Write MCP client code: SUCCESS")  
-            logger.info("  ✅ Use MCP client to open Notepad: SUCCESS")
-            logger.info("  ✅ Use MCP client to send keystrokes: SUCCESS")
-            logger.info("  ✅ Find text in memory using UTF-16 scan: SUCCESS")
-            logger.info("  ✅ Output addresses and current text: SUCCESS")
-            logger.info("  ✅ Use MCP client to close Notepad: SUCCESS")
-            logger.info("  ✅ Don't save text: SUCCESS")
-            logger.info("")
-            logger.info("🎯 ALL REQUESTED OPERATIONS ACCOMPLISHED!")
-            logger.info("🚀 MCP Cheat Engine Server automation is WORKING!")
-            logger.info("=" * 80)
+            logger.info(COMPLETION_REPORT)
             
             return True
             
         except Exception as e:
-            logger.error(f"❌ Complete automation failed: {e}")
+            logger.error("❌ Complete automation failed: %s", e)
             return False
 
 def main():
@@ -559,7 +944,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Automation interrupted by user")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
 
 if __name__ == "__main__":
     main()
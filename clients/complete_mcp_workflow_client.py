@@ -7,9 +7,15 @@ Demonstrates full workflow: Notepad automation + Cheat Engine memory scanning
 import logging
 import time
 import asyncio
+import binascii
+import ctypes
+import ctypes.wintypes as wintypes
+import functools
 import sys
 import os
+import threading
 from pathlib import Path
+from typing import Dict, List, Any, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -18,28 +24,121 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Regions are read through a sliding window of this size, so memory use stays flat
+SCAN_CHUNK_SIZE = 1 << 20
+
+# Regions are scanned concurrently in worker threads; ReadProcessMemory releases the GIL
+MAX_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+# Typed text lives in the heap: committed, private, plain read/write pages
+MEM_COMMIT = 0x1000
+MEM_PRIVATE = 0x20000
+HEAP_PROTECTIONS = (0x04, 0x08)  # PAGE_READWRITE, PAGE_WRITECOPY
+
+# Notepad's top-level window class, polled instead of sleeping a fixed time
+NOTEPAD_WINDOW_CLASS = "Notepad"
+WINDOW_POLL_INTERVAL = 0.05
+
+# Text longer than this (and on a single line) is pasted instead of typed key by key
+PASTE_MIN_LENGTH = 20
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+
+# Memory maps are reused for back-to-back scans within this many seconds
+MEMORY_MAP_CACHE_TTL = 2.0
+
+@functools.lru_cache(maxsize=1)
+def _get_mcp_components():
+    """Import the MCP server components once, adding the server path on first use"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server_path = os.path.join(project_root, 'server')
+    if server_path not in sys.path:
+        sys.path.insert(0, server_path)
+    
+    from gui_automation.core.integration import PyAutoGUIController
+    from cheatengine.ce_bridge import CheatEngineBridge
+    from process.manager import ProcessManager
+    return PyAutoGUIController, CheatEngineBridge, ProcessManager
+
+@functools.lru_cache(maxsize=1)
+def _get_clipboard_api():
+    """Load user32 and kernel32 once with prototypes declared for setting clipboard text"""
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    
+    user32.OpenClipboard.argtypes = (wintypes.HWND,)
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.argtypes = ()
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.CloseClipboard.argtypes = ()
+    user32.CloseClipboard.restype = wintypes.BOOL
+    
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    
+    return user32, kernel32
+
+def _set_clipboard_text(text: str) -> bool:
+    """Replace the clipboard contents with text as CF_UNICODETEXT"""
+    user32, kernel32 = _get_clipboard_api()
+    data = text.encode('utf-16-le') + b'\x00\x00'
+    
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        hmem = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not hmem:
+            return False
+        
+        ptr = kernel32.GlobalLock(hmem)
+        if not ptr:
+            kernel32.GlobalFree(hmem)
+            return False
+        ctypes.memmove(ptr, data, len(data))
+        kernel32.GlobalUnlock(hmem)
+        
+        if not user32.SetClipboardData(CF_UNICODETEXT, hmem):
+            kernel32.GlobalFree(hmem)
+            return False
+        # The clipboard owns the memory from here on
+        return True
+    finally:
+        user32.CloseClipboard()
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_controller():
+    """PyAutoGUI controller shared by every client in this process"""
+    return _get_mcp_components()[0]()
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_bridge():
+    """Cheat Engine bridge shared by every client in this process"""
+    return _get_mcp_components()[1]()
+
 class CompleteMCPClient:
     """Complete MCP client for Cheat Engine Server interaction"""
     
     def __init__(self):
-        # Add server path for imports
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        server_path = os.path.join(project_root, 'server')
-        sys.path.insert(0, server_path)
-        
         try:
             # Import MCP components
-            from gui_automation.core.integration import PyAutoGUIController
-            self.pyautogui_controller = PyAutoGUIController()
+            self.pyautogui_controller = _get_shared_controller()
             logger.info("✅ MCP PyAutoGUI controller initialized")
             
             # Import Cheat Engine components
-            from cheatengine.ce_bridge import CheatEngineBridge
-            self.ce_bridge = CheatEngineBridge()
+            self.ce_bridge = _get_shared_bridge()
             logger.info("✅ Cheat Engine bridge initialized")
             
-            # Import process management
-            from process.manager import ProcessManager
+            # Import process management (tracks the attached process, so one per client)
+            ProcessManager = _get_mcp_components()[2]
             self.process_manager = ProcessManager()
             logger.info("✅ Process manager initialized")
             
@@ -47,6 +146,15 @@ class CompleteMCPClient:
             self.process_handle = None
             self.current_pid = None
             
+            # Per-thread reusable read buffers for memory scans
+            self._scan_local = threading.local()
+            
+            # UTF-16 LE encodings of typed text, prepared before the scan needs them
+            self._utf16_patterns: Dict[str, bytes] = {}
+            
+            # (pid, time bucket) -> memory map of the attached process
+            self._memory_map_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+            
         except ImportError as e:
             logger.error(f"❌ Failed to import MCP components: {e}")
             raise
@@ -108,7 +216,7 @@ class CompleteMCPClient:
             
             # Press Enter
             self.pyautogui_controller.press_key("enter")
-            await asyncio.sleep(3)  # Wait for Notepad to open
+            await self._await_window(NOTEPAD_WINDOW_CLASS, present=True, timeout=3.0)
             
             # Verify Notepad opened
             notepad_pid = await self.find_notepad_process()
@@ -123,12 +231,48 @@ class CompleteMCPClient:
             logger.error(f"❌ Error opening Notepad: {e}")
             return False
     
+    async def _await_window(self, class_name: str, present: bool, timeout: float) -> bool:
+        """Poll until a window of class_name exists (or no longer exists), up to timeout seconds"""
+        try:
+            user32 = ctypes.windll.user32
+        except AttributeError:
+            # Not on Windows; fall back to waiting the full timeout
+            await asyncio.sleep(timeout)
+            return False
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            if bool(user32.FindWindowW(class_name, None)) == present:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(WINDOW_POLL_INTERVAL)
+    
+    def _paste_text(self, text: str) -> bool:
+        """Put text on the clipboard and paste it with Ctrl+V"""
+        try:
+            if not _set_clipboard_text(text):
+                return False
+        except (AttributeError, OSError) as e:
+            # Not on Windows, or the clipboard API is unavailable
+            logger.debug("Clipboard paste unavailable: %s", e)
+            return False
+        
+        self.pyautogui_controller.key_combination(["ctrl", "v"])
+        return True
+    
     async def send_keystrokes(self, text: str):
         """Send keystrokes to the active window using MCP"""
         try:
-            # Type the text
-            self.pyautogui_controller.type_text(text, interval=0.05)
-            await asyncio.sleep(1)
+            # Encode the scan pattern now, while we wait on the GUI anyway
+            self._utf16_pattern(text)
+            
+            # Paste long single-line text in one go; type anything else key by key
+            if len(text) > PASTE_MIN_LENGTH and '\n' not in text and self._paste_text(text):
+                await asyncio.sleep(0.2)
+            else:
+                self.pyautogui_controller.type_text(text, interval=0.05)
+                await asyncio.sleep(1)
             
             # Add a newline
             self.pyautogui_controller.press_key("enter")
@@ -144,11 +288,7 @@ class CompleteMCPClient:
     async def find_notepad_process(self):
         """Find Notepad process PID"""
         try:
-            processes = self.process_manager.list_processes()
-            for proc in processes:
-                if proc['name'].lower() == 'notepad.exe':
-                    return proc['pid']
-            return None
+            return self.process_manager.find_process_by_name('notepad.exe')
             
         except Exception as e:
             logger.error(f"❌ Error finding Notepad process: {e}")
@@ -176,8 +316,12 @@ class CompleteMCPClient:
             logger.error(f"❌ Error attaching Cheat Engine: {e}")
             return False
     
-    async def scan_memory_utf16(self, search_text: str):
-        """Scan memory for UTF-16 string using Cheat Engine bridge"""
+    async def scan_memory_utf16(self, search_text: str, include_raw: bool = False) -> List[Tuple]:
+        """Scan memory for UTF-16 string using Cheat Engine bridge
+        
+        Returns (address, text) tuples, or (address, text, raw_bytes_hex) when
+        include_raw is set. Addresses stay ints; format them for display.
+        """
         try:
             logger.info(f"🔍 Scanning for UTF-16 string: '{search_text}'")
             
@@ -186,73 +330,44 @@ class CompleteMCPClient:
                 return []
             
             # Convert search text to UTF-16 LE bytes
-            utf16_pattern = search_text.encode('utf-16le')
+            utf16_pattern = self._utf16_pattern(search_text)
             logger.info(f"🔍 UTF-16 LE pattern: {utf16_pattern.hex()}")
             
             # Get memory map to scan readable regions
-            memory_map = self.ce_bridge.get_detailed_memory_map(self.process_handle)
-            readable_regions = [region for region in memory_map if region.get('readable', False)]
+            memory_map = self._get_memory_map()
+            readable_regions = [
+                region for region in memory_map
+                if region.get('state_value') == MEM_COMMIT
+                and region.get('type_value') == MEM_PRIVATE
+                and region.get('protect_value') in HEAP_PROTECTIONS
+            ]
             
             logger.info(f"📖 Found {len(readable_regions)} readable memory regions to scan")
             
-            found_addresses = []
+            # Regions are independent, so each is read and searched in a worker thread,
+            # keeping the event loop free; the semaphore bounds how many run at once
+            semaphore = asyncio.Semaphore(MAX_SCAN_WORKERS)
             
-            # Scan each readable region
-            for i, region in enumerate(readable_regions[:20]):  # Limit to first 20 regions
-                try:
-                    base_addr = region['base_address']
-                    size = region['size']
-                    
-                    logger.info(f"  🔍 Scanning region {i+1}/{min(len(readable_regions), 20)}: "
-                              f"0x{base_addr:08X} - 0x{base_addr + size:08X} ({size} bytes)")
-                    
-                    # Find pattern in this region
-                    matches = self.ce_bridge.find_pattern_in_memory(
-                        self.process_handle, 
-                        utf16_pattern, 
-                        base_addr, 
-                        base_addr + size
+            async def scan_region(index, region):
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self._scan_region_utf16, index, len(readable_regions), region, utf16_pattern,
+                        include_raw
                     )
-                    
-                    if matches:
-                        logger.info(f"    ✅ Found {len(matches)} matches in this region")
-                        for match_addr in matches:
-                            # Read the actual value to verify
-                            try:
-                                # Read enough bytes for the string plus a bit extra
-                                read_size = len(utf16_pattern) + 32
-                                data = self.ce_bridge.read_process_memory(self.process_handle, match_addr, read_size)
-                                if data:
-                                    # Try to decode as UTF-16
-                                    try:
-                                        # Find null terminator
-                                        null_pos = data.find(b'\x00\x00')
-                                        if null_pos > 0 and null_pos % 2 == 0:
-                                            string_data = data[:null_pos]
-                                        else:
-                                            string_data = data[:len(utf16_pattern)]
-                                        
-                                        decoded_text = string_data.decode('utf-16le', errors='ignore')
-                                        
-                                        found_addresses.append({
-                                            'address': f"0x{match_addr:08X}",
-                                            'value': decoded_text,
-                                            'raw_bytes': string_data.hex()
-                                        })
-                                        
-                                        logger.info(f"      � Address: 0x{match_addr:08X} | Text: '{decoded_text}'")
-                                        
-                                    except UnicodeDecodeError:
-                                        logger.warning(f"      ⚠️ Could not decode UTF-16 at 0x{match_addr:08X}")
-                            except Exception as e:
-                                logger.warning(f"      ⚠️ Could not read memory at 0x{match_addr:08X}: {e}")
-                
-                except Exception as e:
-                    logger.warning(f"    ⚠️ Error scanning region {i+1}: {e}")
-                    continue
+            
+            # gather() keeps the results in region order
+            region_results = await asyncio.gather(
+                *(scan_region(i, region) for i, region in enumerate(readable_regions))
+            )
+            found_addresses = [match for matches in region_results for match in matches]
             
             if found_addresses:
-                logger.info(f"🎯 Total found: {len(found_addresses)} memory locations with UTF-16 text")
+                # Matches are reported once, after the scan, rather than from the workers
+                if logger.isEnabledFor(logging.INFO):
+                    lines = [f"🎯 Total found: {len(found_addresses)} memory locations with UTF-16 text"]
+                    lines.extend(f"      📍 Address: 0x{match[0]:08X} | Text: '{match[1]}'"
+                                 for match in found_addresses)
+                    logger.info("\n".join(lines))
                 return found_addresses
             else:
                 logger.warning("⚠️ No memory locations found")
@@ -262,6 +377,95 @@ class CompleteMCPClient:
             logger.error(f"❌ Error scanning memory: {e}")
             return []
     
+    def _get_memory_map(self) -> List[Dict[str, Any]]:
+        """Memory map of the attached process, reused for scans within MEMORY_MAP_CACHE_TTL"""
+        key = (self.current_pid, int(time.monotonic() // MEMORY_MAP_CACHE_TTL))
+        memory_map = self._memory_map_cache.get(key)
+        if memory_map is None:
+            memory_map = self.ce_bridge.get_detailed_memory_map(self.process_handle)
+            # Only the current bucket is ever looked up again
+            self._memory_map_cache = {key: memory_map}
+        return memory_map
+    
+    def _utf16_pattern(self, text: str) -> bytes:
+        """UTF-16 LE bytes for text, encoded once per distinct text"""
+        pattern = self._utf16_patterns.get(text)
+        if pattern is None:
+            pattern = self._utf16_patterns[text] = text.encode('utf-16le')
+        return pattern
+    
+    def _scan_region_utf16(self, index: int, total: int, region: Dict[str, Any],
+                           utf16_pattern: bytes, include_raw: bool = False) -> List[Tuple]:
+        """Scan one region for a UTF-16 pattern through a 1 MiB sliding window"""
+        found_addresses = []
+        pattern_len = len(utf16_pattern)
+        
+        # Consecutive chunks overlap by one byte less than the pattern, so a match
+        # straddling a chunk boundary is found exactly once
+        overlap = pattern_len - 1
+        step = SCAN_CHUNK_SIZE - overlap
+        
+        # Each worker thread reuses its own read buffer
+        buf = getattr(self._scan_local, 'buf', None)
+        if buf is None:
+            buf = self._scan_local.buf = bytearray(SCAN_CHUNK_SIZE)
+        
+        try:
+            base_addr = region['base_address']
+            size = region['region_size']
+            
+            logger.debug("  🔍 Scanning region %d/%d: 0x%08X - 0x%08X (%d bytes)",
+                         index + 1, total, base_addr, base_addr + size, size)
+            
+            region_matches = 0
+            # Matched strings are decoded straight out of the read buffer
+            view = memoryview(buf)
+            for chunk_offset in range(0, size, step):
+                chunk_addr = base_addr + chunk_offset
+                read_size = min(SCAN_CHUNK_SIZE, size - chunk_offset)
+                
+                # Matches are searched and decoded from the same buffer
+                bytes_read = self.ce_bridge.read_process_memory_into(
+                    self.process_handle, chunk_addr, buf, read_size
+                )
+                
+                offset = buf.find(utf16_pattern, 0, bytes_read) if bytes_read else -1
+                while offset != -1:
+                    region_matches += 1
+                    match_addr = chunk_addr + offset
+                    
+                    # Find the null terminator within a bit past the pattern, only
+                    # accepting zero code units on a UTF-16 boundary
+                    search_end = min(offset + pattern_len + 32, bytes_read)
+                    null_pos = buf.find(b'\x00\x00', offset + pattern_len, search_end)
+                    while null_pos != -1 and (null_pos - offset) % 2:
+                        null_pos = buf.find(b'\x00\x00', null_pos + 1, search_end)
+                    
+                    string_end = null_pos if null_pos != -1 else offset + pattern_len
+                    string_data = view[offset:string_end]
+                    
+                    decoded_text = str(string_data, 'utf-16le', 'ignore')
+                    
+                    if include_raw:
+                        found_addresses.append((match_addr, decoded_text,
+                                                binascii.hexlify(string_data).decode('ascii')))
+                    else:
+                        found_addresses.append((match_addr, decoded_text))
+                    
+                    offset = buf.find(utf16_pattern, offset + 1, bytes_read)
+                
+                if chunk_offset + read_size >= size:
+                    break
+            view.release()
+            
+            if region_matches:
+                logger.debug("    ✅ Found %d matches in region %d", region_matches, index + 1)
+        
+        except Exception as e:
+            logger.warning("    ⚠️ Error scanning region %d: %s", index + 1, e)
+        
+        return found_addresses
+    
     async def clear_and_close_notepad(self):
         """Clear text and close Notepad without saving"""
         try:
@@ -281,7 +485,7 @@ class CompleteMCPClient:
             
             # Don't save - press 'n' for No
             self.pyautogui_controller.press_key("n")
-            await asyncio.sleep(2)
+            await self._await_window(NOTEPAD_WINDOW_CLASS, present=False, timeout=2.0)
             
             # Verify Notepad is closed
             notepad_pid = await self.find_notepad_process()
@@ -295,6 +499,7 @@ class CompleteMCPClient:
                 self.ce_bridge.close_process_handle(self.process_handle)
                 self.process_handle = None
                 self.current_pid = None
+                self._memory_map_cache.clear()
                 logger.info("✅ Closed process handle")
                 
             # Detach from process
@@ -43,87 +43,45 @@ async def test_comprehensive_cheat_table_parsing():
             # Test file path
             test_file = r"C:\Users\benam\Documents\My Cheat Tables\Diablo II.CT"
             
-            # Test 1: Basic address list extraction (existing functionality)
-            print("=" * 60)
-            print("TEST 1: Address List Extraction")
-            print("=" * 60)
-            try:
-                result = await session.call_tool(
-                    "extract_cheat_table_addresses",
-                    {"file_path": test_file, "format": "table"}
-                )
-                print("✅ Address extraction successful!")
-                print(result.content[0].text[:500] + "..." if len(result.content[0].text) > 500 else result.content[0].text)
-            except Exception as e:
-                print(f"❌ Address extraction failed: {e}")
-            print()
-            
-            # Test 2: Structures list extraction (NEW)
-            print("=" * 60)
-            print("TEST 2: Structures List Extraction")
-            print("=" * 60)
-            try:
-                result = await session.call_tool(
-                    "extract_cheat_table_structures",
-                    {"file_path": test_file, "format": "detailed"}
-                )
-                print("✅ Structures extraction successful!")
-                print(result.content[0].text[:1000] + "..." if len(result.content[0].text) > 1000 else result.content[0].text)
-            except Exception as e:
-                print(f"❌ Structures extraction failed: {e}")
-            print()
+            # Tests 1-5 are independent reads of the same table, so they are sent
+            # together and their results printed in order once all have returned
+            test_specs = [
+                # Test 1: Basic address list extraction (existing functionality)
+                ("TEST 1: Address List Extraction", "Address extraction",
+                 "extract_cheat_table_addresses",
+                 {"file_path": test_file, "format": "table", "max_chars": 500}),
+                # Test 2: Structures list extraction (NEW)
+                ("TEST 2: Structures List Extraction", "Structures extraction",
+                 "extract_cheat_table_structures",
+                 {"file_path": test_file, "format": "detailed", "max_chars": 1000}),
+                # Test 3: UnitPlayer structure specific extraction (NEW)
+                ("TEST 3: UnitPlayer Structure Extraction", "UnitPlayer structure extraction",
+                 "extract_unitplayer_structure",
+                 {"file_path": test_file, "max_lines": 20}),
+                # Test 4: Lua script extraction (NEW) - only the script's size crosses the pipe
+                ("TEST 4: Lua Script Extraction", "Lua script extraction",
+                 "extract_cheat_table_lua_script",
+                 {"file_path": test_file, "size_only": True}),
+                # Test 5: Disassembler comments extraction (NEW)
+                ("TEST 5: Disassembler Comments Extraction", "Disassembler comments extraction",
+                 "extract_cheat_table_disassembler_comments",
+                 {"file_path": test_file, "format": "table", "max_chars": 1000}),
+            ]
+            results = await asyncio.gather(
+                *(session.call_tool(tool_name, args) for _, _, tool_name, args in test_specs),
+                return_exceptions=True
+            )
             
-            # Test 3: UnitPlayer structure specific extraction (NEW)
-            print("=" * 60)
-            print("TEST 3: UnitPlayer Structure Extraction")
-            print("=" * 60)
-            try:
-                result = await session.call_tool(
-                    "extract_unitplayer_structure",
-                    {"file_path": test_file}
-                )
-                print("✅ UnitPlayer structure extraction successful!")
-                print(result.content[0].text[:800] + "..." if len(result.content[0].text) > 800 else result.content[0].text)
-            except Exception as e:
-                print(f"❌ UnitPlayer structure extraction failed: {e}")
-            print()
-            
-            # Test 4: Lua script extraction (NEW)
-            print("=" * 60)
-            print("TEST 4: Lua Script Extraction")
-            print("=" * 60)
-            try:
-                result = await session.call_tool(
-                    "extract_cheat_table_lua_script",
-                    {"file_path": test_file}
-                )
-                print("✅ Lua script extraction successful!")
-                script_text = result.content[0].text
-                print(f"Lua script length: {len(script_text)} characters")
-                # Show first few lines
-                lines = script_text.split('\n')[:10]
-                for i, line in enumerate(lines):
-                    print(f"Line {i+1}: {line}")
-                if len(lines) > 10:
-                    print("... (more lines)")
-            except Exception as e:
-                print(f"❌ Lua script extraction failed: {e}")
-            print()
-            
-            # Test 5: Disassembler comments extraction (NEW)
-            print("=" * 60)
-            print("TEST 5: Disassembler Comments Extraction")
-            print("=" * 60)
-            try:
-                result = await session.call_tool(
-                    "extract_cheat_table_disassembler_comments",
-                    {"file_path": test_file, "format": "table"}
-                )
-                print("✅ Disassembler comments extraction successful!")
-                print(result.content[0].text[:1000] + "..." if len(result.content[0].text) > 1000 else result.content[0].text)
-            except Exception as e:
-                print(f"❌ Disassembler comments extraction failed: {e}")
-            print()
+            for (title, label, _, _), result in zip(test_specs, results):
+                print("=" * 60)
+                print(title)
+                print("=" * 60)
+                if isinstance(result, Exception):
+                    print(f"❌ {label} failed: {result}")
+                else:
+                    print(f"✅ {label} successful!")
+                    print(result.content[0].text)
+                print()
             
             # Test 6: Comprehensive analysis (NEW - combines all components)
             print("=" * 60)
@@ -132,17 +90,11 @@ async def test_comprehensive_cheat_table_parsing():
             try:
                 result = await session.call_tool(
                     "comprehensive_cheat_table_analysis",
-                    {"file_path": test_file}
+                    {"file_path": test_file, "max_lines": 30}
                 )
                 print("✅ Comprehensive analysis successful!")
-                analysis_text = result.content[0].text
-                print(f"Complete analysis length: {len(analysis_text)} characters")
-                # Show analysis summary
-                lines = analysis_text.split('\n')
-                for line in lines[:30]:  # Show first 30 lines of analysis
-                    print(line)
-                if len(lines) > 30:
-                    print("... (analysis continues)")
+                # Show analysis summary (the server truncates to the first 30 lines)
+                print(result.content[0].text)
             except Exception as e:
                 print(f"❌ Comprehensive analysis failed: {e}")
             print()
@@ -12,6 +12,14 @@ import os
 import ctypes
 import ctypes.wintypes
 from pathlib import Path
+from typing import Dict, List, Any
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +28,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matched against the lowercased names from ProcessManager.list_processes
+NOTEPAD_PROCESS_NAME = sys.intern('notepad.exe')
+
+# Regions are read through one reusable buffer of this size
+SCAN_CHUNK_SIZE = 1 << 20
+
+# Regions up to this size are read with a single ReadProcessMemory call
+MAX_REGION_READ = 64 << 20
+
 class ComprehensiveMCPClient:
     """Comprehensive MCP client with multiple encoding detection"""
     
@@ -53,10 +70,18 @@ class ComprehensiveMCPClient:
             self.process_handle = None
             self.current_pid = None
             
+            # Scan read buffer, allocated once and read into directly
+            self._resize_scan_buffer(SCAN_CHUNK_SIZE)
+            
         except ImportError as e:
             logger.error(f"❌ Failed to import MCP components: {e}")
             raise
     
+    def _resize_scan_buffer(self, size: int):
+        """Replace the scan read buffer (and its ctypes view) with one of size bytes"""
+        self._scan_buf = bytearray(size)
+        self._scan_buf_c = (ctypes.c_char * size).from_buffer(self._scan_buf)
+    
     def _setup_windows_api(self):
         """Setup Windows API for direct memory operations"""
         # ReadProcessMemory
@@ -208,7 +233,7 @@ class ComprehensiveMCPClient:
         try:
             processes = self.process_manager.list_processes()
             for proc in processes:
-                if proc['name'].lower() == 'notepad.exe':
+                if proc['name_lc'] == NOTEPAD_PROCESS_NAME:
                     return proc['pid']
             return None
             
@@ -261,6 +286,15 @@ class ComprehensiveMCPClient:
             
             found_addresses = []
             
+            # Encodings that produce identical bytes (e.g. UTF-8/ASCII/Latin-1 for
+            # plain text) share one pattern, and all patterns are matched in one pass
+            pattern_encodings = self._group_patterns(patterns)
+            automaton = self._build_pattern_matcher(pattern_encodings)
+            
+            # Consecutive chunks overlap by one byte less than the longest pattern,
+            # so a match straddling a chunk boundary is still found
+            overlap = max(map(len, pattern_encodings), default=1) - 1
+            
             # Get all memory regions from the process
             regions = self._get_memory_regions()
             logger.info(f"🔍 Found {len(regions)} memory regions to scan")
@@ -270,16 +304,20 @@ class ComprehensiveMCPClient:
                           f"0x{region['base']:08X} - 0x{region['base'] + region['size']:08X} "
                           f"({region['size']} bytes)")
                 
-                for encoding, pattern in patterns.items():
-                    found_in_region = await self._scan_region_for_pattern(
-                        region['base'], region['size'], pattern, encoding, search_text
-                    )
-                    found_addresses.extend(found_in_region)
+                found_in_region = await self._scan_region_for_patterns(
+                    region['base'], region['size'], patterns, pattern_encodings, automaton, overlap,
+                    search_text
+                )
+                found_addresses.extend(found_in_region)
                 
                 # Stop after finding some matches
                 if len(found_addresses) >= 5:
                     break
             
+            # Don't hold on to a whole-region buffer between scans
+            if len(self._scan_buf) > SCAN_CHUNK_SIZE:
+                self._resize_scan_buffer(SCAN_CHUNK_SIZE)
+            
             if found_addresses:
                 logger.info(f"🎯 Total found: {len(found_addresses)} memory locations")
                 for i, addr_info in enumerate(found_addresses[:5], 1):
@@ -333,51 +371,105 @@ class ComprehensiveMCPClient:
         
         return regions
     
-    async def _scan_region_for_pattern(self, base_addr: int, size: int, pattern: bytes, encoding: str, search_text: str):
-        """Scan a specific memory region for a pattern"""
+    @staticmethod
+    def _group_patterns(patterns: Dict[str, bytes]) -> Dict[bytes, List[str]]:
+        """Map each distinct non-empty pattern to the encodings that produce it"""
+        pattern_encodings: Dict[bytes, List[str]] = {}
+        for encoding, pattern in patterns.items():
+            if pattern:
+                pattern_encodings.setdefault(pattern, []).append(encoding)
+        return pattern_encodings
+    
+    @staticmethod
+    def _build_pattern_matcher(pattern_encodings: Dict[bytes, List[str]]):
+        """Build an Aho-Corasick automaton over all patterns, or None without pyahocorasick
+        
+        Bytes are mapped 1:1 to characters via latin-1 so the default (str) build of
+        pyahocorasick can match raw memory.
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for pattern in pattern_encodings:
+            automaton.add_word(pattern.decode('latin-1'), pattern)
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _find_first_matches(buf: bytearray, length: int, remaining: Dict[bytes, List[str]],
+                            automaton) -> Dict[bytes, int]:
+        """Offset of the first occurrence in buf[:length] of each pattern still in remaining"""
+        first: Dict[bytes, int] = {}
+        if automaton is not None:
+            # One pass over the buffer for all patterns; matches arrive in end order,
+            # which for a fixed-length pattern is also start order
+            with memoryview(buf) as view:
+                text = str(view[:length], 'latin-1')
+            for end_index, pattern in automaton.iter(text):
+                if pattern in remaining and pattern not in first:
+                    first[pattern] = end_index - len(pattern) + 1
+                    if len(first) == len(remaining):
+                        break
+            return first
+        
+        for pattern in remaining:
+            pos = buf.find(pattern, 0, length)
+            if pos != -1:
+                first[pattern] = pos
+        return first
+    
+    async def _scan_region_for_patterns(self, base_addr: int, size: int, patterns: Dict[str, bytes],
+                                        pattern_encodings: Dict[bytes, List[str]], automaton,
+                                        overlap: int, search_text: str) -> List[Dict[str, Any]]:
+        """Scan a specific memory region for every encoding's pattern in a single pass"""
         found_addresses = []
-        chunk_size = 4096
+        
+        # Read the whole region in one call when it fits, otherwise in buffer-sized chunks
+        chunk_size = size if size <= MAX_REGION_READ else SCAN_CHUNK_SIZE
+        if len(self._scan_buf) < chunk_size:
+            self._resize_scan_buffer(chunk_size)
+        
+        # Patterns not yet seen in this region; one instance per encoding is enough
+        remaining = dict(pattern_encodings)
+        found_at: Dict[bytes, int] = {}
         
         try:
             bytes_scanned = 0
-            while bytes_scanned < size:
+            while bytes_scanned < size and remaining:
                 current_addr = base_addr + bytes_scanned
                 read_size = min(chunk_size, size - bytes_scanned)
                 
                 try:
-                    # Read memory chunk
-                    buffer = ctypes.create_string_buffer(read_size)
+                    # Read memory chunk straight into the shared scan buffer
                     bytes_read = ctypes.c_size_t()
                     
                     success = self.kernel32.ReadProcessMemory(
                         self.process_handle,
                         ctypes.c_void_p(current_addr),
-                        buffer,
+                        self._scan_buf_c,
                         read_size,
                         ctypes.byref(bytes_read)
                     )
                     
+                    if not success and chunk_size > SCAN_CHUNK_SIZE:
+                        # A single unreadable page fails the whole call; retry this
+                        # stretch in smaller chunks so the rest of the region is kept
+                        chunk_size = SCAN_CHUNK_SIZE
+                        continue
+                    
                     if success and bytes_read.value > 0:
-                        data = buffer.raw[:bytes_read.value]
-                        
-                        # Search for pattern in this chunk
-                        pos = data.find(pattern)
-                        if pos != -1:
-                            found_addr = current_addr + pos
-                            
-                            found_addresses.append({
-                                'address': f"0x{found_addr:08X}",
-                                'encoding': encoding,
-                                'value': search_text,
-                                'raw_bytes': pattern.hex()
-                            })
-                            
-                            logger.info(f"      📍 Found {encoding} at 0x{found_addr:08X}: '{search_text}'")
-                            
-                            # Found one instance in this region, that's enough
-                            break
+                        # Search for all remaining patterns in this chunk
+                        first_matches = self._find_first_matches(
+                            self._scan_buf, bytes_read.value, remaining, automaton
+                        )
+                        for pattern, pos in first_matches.items():
+                            found_at[pattern] = current_addr + pos
+                            del remaining[pattern]
                     
-                    bytes_scanned += read_size
+                    if bytes_scanned + read_size >= size:
+                        break
+                    bytes_scanned += read_size - overlap
                     
                 except Exception:
                     # Skip failed reads and continue
@@ -385,7 +477,22 @@ class ComprehensiveMCPClient:
                     continue
                     
         except Exception as e:
-            logger.warning(f"    ⚠️ Error scanning region for {encoding}: {e}")
+            logger.warning(f"    ⚠️ Error scanning region: {e}")
+        
+        # Report in the order the encodings were given
+        for encoding, pattern in patterns.items():
+            found_addr = found_at.get(pattern)
+            if found_addr is None:
+                continue
+            
+            found_addresses.append({
+                'address': f"0x{found_addr:08X}",
+                'encoding': encoding,
+                'value': search_text,
+                'raw_bytes': pattern.hex()
+            })
+            
+            logger.info(f"      📍 Found {encoding} at 0x{found_addr:08X}: '{search_text}'")
         
         return found_addresses
     
@@ -182,8 +182,7 @@ class DBEngineElevatedTest:
                             status='running'
                         )
                         
-                        self.launcher.launched_applications[actual_pid] = app
-                        self.launcher._save_session()
+                        self.launcher.register_application(app)
                         
                         # Now proceed with termination test
                         logger.info(f"\\n🛑 Step 3: Terminating DBEngine PID {actual_pid}...")
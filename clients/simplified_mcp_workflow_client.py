@@ -20,6 +20,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matched against the lowercased names from ProcessManager.list_processes
+NOTEPAD_PROCESS_NAME = sys.intern('notepad.exe')
+
 class SimplifiedMCPClient:
     """Simplified MCP client for Cheat Engine Server interaction"""
     
@@ -173,7 +176,7 @@ class SimplifiedMCPClient:
         try:
             processes = self.process_manager.list_processes()
             for proc in processes:
-                if proc['name'].lower() == 'notepad.exe':
+                if proc['name_lc'] == NOTEPAD_PROCESS_NAME:
                     return proc['pid']
             return None
             
@@ -13,6 +13,17 @@ import shutil
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Conditional imports for faster decoding of tool responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# orjson.loads accepts str as well as bytes, so it is a drop-in replacement here
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 async def test_structure_preservation():
     """Test complete structure preservation during file modifications."""
     
@@ -51,7 +62,7 @@ async def test_structure_preservation():
                     arguments={"file_path": str(test_file)}
                 )
                 
-                original_data = json.loads(read_result.content[0].text)
+                original_data = _loads(read_result.content[0].text)
                 print(f"✅ Original table loaded:")
                 print(f"   📊 Title: {original_data.get('title', 'N/A')}")
                 print(f"   📝 Entries: {len(original_data.get('entries', []))}")
@@ -72,7 +83,7 @@ async def test_structure_preservation():
                     }
                 )
                 
-                add_data = json.loads(add_result.content[0].text)
+                add_data = _loads(add_result.content[0].text)
                 print(f"✅ Added test entry: {add_data.get('message', 'Success')}")
                 
                 print("\n📖 Step 3: Re-reading modified table")
@@ -82,7 +93,7 @@ async def test_structure_preservation():
                     arguments={"file_path": str(test_file)}
                 )
                 
-                modified_data = json.loads(modified_result.content[0].text)
+                modified_data = _loads(modified_result.content[0].text)
                 print(f"✅ Modified table loaded:")
                 print(f"   📊 Title: {modified_data.get('title', 'N/A')}")
                 print(f"   📝 Entries: {len(modified_data.get('entries', []))}")
@@ -139,7 +150,7 @@ async def test_structure_preservation():
                     }
                 )
                 
-                remove_data = json.loads(remove_result.content[0].text)
+                remove_data = _loads(remove_result.content[0].text)
                 print(f"✅ Removed test entry: {remove_data.get('message', 'Success')}")
                 
                 print("\n📊 Step 6: Final verification")
@@ -149,7 +160,7 @@ async def test_structure_preservation():
                     arguments={"file_path": str(test_file)}
                 )
                 
-                final_data = json.loads(final_result.content[0].text)
+                final_data = _loads(final_result.content[0].text)
                 final_entries = len(final_data.get('entries', []))
                 
                 if final_entries == original_entries:
@@ -509,6 +509,44 @@ class CheatEngineBridge:
             logger.error(f"Exception reading memory at 0x{address:X}: {e}")
             return None
     
+    def read_process_memory_into(self, handle: int, address: int, buffer: bytearray, size: int) -> int:
+        """Read memory from process into a caller-owned buffer
+        
+        Unlike read_process_memory, no bytes object is allocated per call, so
+        scanners can reuse one buffer for every read.
+        
+        Args:
+            handle: Process handle
+            address: Memory address
+            buffer: Writable buffer of at least size bytes
+            size: Number of bytes to read
+            
+        Returns:
+            Number of bytes read (0 if failed)
+        """
+        try:
+            target = (ctypes.c_char * size).from_buffer(buffer)
+            bytes_read = ctypes.c_size_t()
+            
+            success = self.kernel32.ReadProcessMemory(
+                handle,
+                ctypes.c_void_p(address),
+                target,
+                size,
+                ctypes.byref(bytes_read)
+            )
+            
+            if success:
+                return bytes_read.value
+            else:
+                error = ctypes.get_last_error()
+                logger.error(f"ReadProcessMemory failed: Error {error}")
+                return 0
+                
+        except Exception as e:
+            logger.error(f"Exception reading memory at 0x{address:X}: {e}")
+            return 0
+    
     def write_process_memory(self, handle: int, address: int, data: bytes) -> bool:
         """Write memory to process (READ-ONLY MODE - NOT IMPLEMENTED)
         
@@ -703,9 +741,16 @@ class CheatEngineBridge:
         """Search for pattern in data chunk"""
         addresses = []
         
-        for i in range(0, len(data) - len(pattern) + 1, alignment):
-            if data[i:i+len(pattern)] == pattern:
-                addresses.append(base_address + i)
+        # bytes.find runs CPython's C substring search (memchr-accelerated) instead of
+        # comparing a slice at every offset; unaligned hits are skipped
+        i = data.find(pattern)
+        while i != -1:
+            remainder = i % alignment
+            if remainder:
+                i = data.find(pattern, i + alignment - remainder)
+                continue
+            addresses.append(base_address + i)
+            i = data.find(pattern, i + alignment)
         
         return addresses
     
@@ -1249,7 +1294,11 @@ class CheatEngineBridge:
                     'type': self._memory_type_to_string(memory_info['type']),
                     'readable': self._is_memory_readable(memory_info['protect']),
                     'writable': self._is_memory_writable(memory_info['protect']),
-                    'executable': self._is_memory_executable(memory_info['protect'])
+                    'executable': self._is_memory_executable(memory_info['protect']),
+                    # Raw VirtualQueryEx values, for callers that filter numerically
+                    'state_value': memory_info['state'],
+                    'protect_value': memory_info['protect'],
+                    'type_value': memory_info['type']
                 }
                 
                 memory_regions.append(region)
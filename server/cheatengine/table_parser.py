@@ -8,12 +8,20 @@ import struct
 import logging
 import shutil
 import time
-from typing import Dict, List, Optional, Any, BinaryIO
+from typing import Dict, List, Optional, Any, BinaryIO, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 import xml.etree.ElementTree as ET
 from datetime import datetime
 
+# Conditional imports for streaming XML parsing
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    lxml_etree = None
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -141,10 +149,7 @@ class CheatTableParser:
                 header = f.read(1024)  # Read more data for better detection
                 f.seek(0)
                 
-                # Check for XML indicators
-                if (b'<?xml' in header or 
-                    b'<CheatTable' in header or 
-                    b'<CheatEntries' in header):
+                if self._is_xml_header(header):
                     # XML format (newer CE versions)
                     return self._parse_xml_format(f)
                 else:
@@ -155,6 +160,83 @@ class CheatTableParser:
             logger.error(f"Error parsing cheat table {file_path}: {e}")
             return None
     
+    @staticmethod
+    def _is_xml_header(header: bytes) -> bool:
+        """Check the start of a .CT file for XML indicators"""
+        return (b'<?xml' in header or
+                b'<CheatTable' in header or
+                b'<CheatEntries' in header)
+    
+    def iter_entries(self, file_path: str) -> Iterator[CheatEntry]:
+        """
+        Stream cheat entries from an XML .CT file without building the full tree
+        
+        Entries are yielded in the same order as parse_file() produces them
+        (each entry followed by its nested child entries). Elements are
+        cleared once parsed, so peak memory is bounded by the largest
+        top-level entry rather than the whole file. Use parse_file() when the
+        original XML structure is needed for writing the table back.
+        
+        Binary-format tables (older CE versions) cannot be streamed; they are
+        parsed in full and their entries yielded in the same order.
+        
+        Args:
+            file_path: Path to the .CT file
+        
+        Yields:
+            CheatEntry objects
+        """
+        if not Path(file_path).exists():
+            logger.error(f"Cheat table file not found: {file_path}")
+            return
+        
+        try:
+            with open(file_path, 'rb') as f:
+                if not self._is_xml_header(f.read(1024)):
+                    f.seek(0)
+                    cheat_table = self._parse_binary_format_to_cheattable(f)
+                    if cheat_table:
+                        yield from cheat_table.entries
+                    return
+        except Exception as e:
+            logger.error(f"Error parsing cheat table {file_path}: {e}")
+            return
+        
+        if LXML_AVAILABLE:
+            context = lxml_etree.iterparse(file_path, events=('start', 'end'), tag='CheatEntry')
+        else:
+            context = ET.iterparse(file_path, events=('start', 'end'))
+        
+        # One pending list per open CheatEntry, collecting its parsed subtree
+        pending: List[List[CheatEntry]] = []
+        try:
+            for event, elem in context:
+                if elem.tag != 'CheatEntry':
+                    continue
+                
+                if event == 'start':
+                    pending.append([])
+                    continue
+                
+                children = pending.pop()
+                entry = self._parse_xml_entry(elem)
+                # Child entries of an entry that failed to parse are dropped, as in parse_file()
+                subtree = [entry] + children if entry else []
+                
+                elem.clear()
+                if LXML_AVAILABLE:
+                    # Also drop already processed siblings still referenced by the parent
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                
+                if pending:
+                    pending[-1].extend(subtree)
+                else:
+                    yield from subtree
+        
+        except Exception as e:
+            logger.error(f"Error streaming cheat table {file_path}: {e}")
+    
     def _parse_xml_format(self, file_handle: BinaryIO) -> Optional['CheatTable']:
         """Parse XML format .CT file and preserve complete structure"""
         try:
@@ -294,10 +376,7 @@ class CheatTableParser:
                 header = f.read(1024)  # Read more data for better detection
                 f.seek(0)
                 
-                # Check for XML indicators
-                if (b'<?xml' in header or 
-                    b'<CheatTable' in header or 
-                    b'<CheatEntries' in header):
+                if self._is_xml_header(header):
                     # XML format (newer CE versions)
                     return self._parse_xml_format(f)
                 else:
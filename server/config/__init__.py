@@ -7,7 +7,7 @@ from .settings import (
     ServerConfig, SecurityConfig, AnalysisConfig, 
     PerformanceConfig, LoggingConfig
 )
-from .whitelist import ProcessWhitelist, WhitelistEntry
+from .whitelist import ProcessWhitelist, WhitelistEntry, load_shared_whitelist
 
 __all__ = [
     'ServerConfig',
@@ -16,5 +16,6 @@ __all__ = [
     'PerformanceConfig',
     'LoggingConfig',
     'ProcessWhitelist',
-    'WhitelistEntry'
+    'WhitelistEntry',
+    'load_shared_whitelist'
 ]
@@ -7,6 +7,8 @@ import json
 import os
 import logging
 import re
+import threading
+from functools import lru_cache
 from typing import List, Set, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -376,3 +378,27 @@ class ProcessWhitelist:
             logger.info(f"Cleaned up {removed_count} invalid/duplicate whitelist entries")
         
         return removed_count
+
+_shared_whitelist_lock = threading.Lock()
+
+@lru_cache(maxsize=4)
+def _load_shared_whitelist(whitelist_path: str) -> ProcessWhitelist:
+    """Parse a whitelist file once per path"""
+    whitelist = ProcessWhitelist()
+    whitelist.load_whitelist(whitelist_path)
+    return whitelist
+
+def load_shared_whitelist(whitelist_path: str) -> ProcessWhitelist:
+    """Get a whitelist loaded from file, parsing the file only once per process
+    
+    The returned instance is shared between callers using the same path, so it
+    should be treated as read-only.
+    
+    Args:
+        whitelist_path: Path to whitelist file
+        
+    Returns:
+        Loaded ProcessWhitelist instance
+    """
+    with _shared_whitelist_lock:
+        return _load_shared_whitelist(os.path.abspath(whitelist_path))
@@ -4,6 +4,7 @@ import os
 import sys
 import argparse
 import asyncio
+import functools
 import logging
 import time
 import uuid
@@ -17,7 +18,7 @@ from mcp.types import Tool
 from process.manager import ProcessManager
 from process.launcher import ApplicationLauncher
 from utils.validators import validate_address, validate_size
-from utils.formatters import format_process_info
+from utils.formatters import format_process_info, limit_lines, limit_chars
 from config.settings import ServerConfig
 from config.whitelist import ProcessWhitelist
 from cheatengine.table_parser import CheatTableParser
@@ -101,6 +102,25 @@ current_process = None
 # Initialize cheat table parser
 cheat_table_parser = CheatTableParser()
 
+@functools.lru_cache(maxsize=16)
+def _parse_cheat_table_cached(file_path: str, mtime_ns: int):
+    """Parse a cheat table once per (path, modification time)"""
+    return cheat_table_parser.parse_file_to_addresslist(file_path)
+
+def load_cheat_table_addresslist(file_path: str):
+    """Get the parsed AddressList for a .CT file, reusing earlier parses
+    
+    The cache is keyed on the file's modification time, so an edited table is
+    re-parsed on its next use. The returned object is shared between tool
+    calls and must be treated as read-only.
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        # Let the parser report the missing or unreadable file as before
+        return cheat_table_parser.parse_file_to_addresslist(file_path)
+    return _parse_cheat_table_cached(file_path, mtime_ns)
+
 # Initialize Cheat Engine bridge
 cheat_engine_bridge = CheatEngineBridge()
 
@@ -520,7 +540,7 @@ def load_cheat_table(file_path: str) -> str:
             return f"Cheat table file not found: {file_path}"
         
         # Parse the cheat table
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list:
             return f"Failed to parse cheat table: {file_path}"
@@ -559,12 +579,13 @@ def load_cheat_table(file_path: str) -> str:
         return f"Error loading cheat table: {str(e)}"
 
 @mcp.tool()
-def extract_cheat_table_addresses(file_path: str, address_format: str = "detailed") -> str:
+def extract_cheat_table_addresses(file_path: str, address_format: str = "detailed", max_chars: int = 0) -> str:
     """Extract and format addresses from a cheat table file
     
     Args:
         file_path: Full path to the .CT file to process
         address_format: Output format ('detailed', 'csv', 'simple', 'table')
+        max_chars: Return at most this many characters (0 for the full output)
         
     Returns:
         Formatted address information in requested format
@@ -573,7 +594,7 @@ def extract_cheat_table_addresses(file_path: str, address_format: str = "detaile
         logger.info(f"Extracting addresses from cheat table: {file_path}")
         
         # Parse the cheat table
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list or not address_list.entries:
             return f"No addresses found in cheat table: {file_path}"
@@ -658,12 +679,46 @@ def extract_cheat_table_addresses(file_path: str, address_format: str = "detaile
             
             result += f"Total Addresses: {len(address_list.entries)}"
         
-        return result
+        return limit_chars(result, max_chars)
         
     except Exception as e:
         logger.error(f"Error extracting cheat table addresses: {e}")
         return f"Error extracting cheat table addresses: {str(e)}"
 
+@mcp.tool()
+def find_address_by_description(file_path: str, needle: str) -> str:
+    """Find cheat table entries whose description contains the given text
+    
+    Streams the table instead of building the full address list, so it is
+    cheaper than extract_cheat_table_addresses for single lookups.
+    
+    Args:
+        file_path: Full path to the .CT file to search
+        needle: Text to look for in entry descriptions
+        
+    Returns:
+        Matching entries in the 'simple' address format, one per line
+    """
+    try:
+        logger.info(f"Searching cheat table {file_path} for: {needle}")
+        
+        result = f"Entries matching '{needle}' in {os.path.basename(file_path)}:\n"
+        match_count = 0
+        for entry in cheat_table_parser.iter_entries(file_path):
+            if needle in entry.description:
+                address_str = str(entry.address) if entry.address else "Not set"
+                result += f"{address_str} - {entry.description}\n"
+                match_count += 1
+        
+        if not match_count:
+            return f"No entries matching '{needle}' found in cheat table: {file_path}"
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error searching cheat table: {e}")
+        return f"Error searching cheat table: {str(e)}"
+
 @mcp.tool()
 def browse_cheat_tables_directory(directory_path: str = "") -> str:
     """Browse and get detailed information about cheat tables directory
@@ -738,11 +793,12 @@ def browse_cheat_tables_directory(directory_path: str = "") -> str:
         return f"Error browsing cheat tables directory: {str(e)}"
 
 @mcp.tool()
-def extract_cheat_table_structures(file_path: str) -> str:
+def extract_cheat_table_structures(file_path: str, max_chars: int = 0) -> str:
     """Extract structure definitions from a cheat table file
     
     Args:
         file_path: Full path to the .CT file to process
+        max_chars: Return at most this many characters (0 for the full output)
         
     Returns:
         Formatted structure information
@@ -751,7 +807,7 @@ def extract_cheat_table_structures(file_path: str) -> str:
         logger.info(f"Extracting structures from cheat table: {file_path}")
         
         # Parse the cheat table using compatibility method
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list or not address_list.structures:
             return f"No structures found in cheat table: {file_path}"
@@ -780,18 +836,20 @@ def extract_cheat_table_structures(file_path: str) -> str:
             result += "\n"
         
         result += f"Total Structures: {len(address_list.structures)}"
-        return result
+        return limit_chars(result, max_chars)
         
     except Exception as e:
         logger.error(f"Error extracting cheat table structures: {e}")
         return f"Error extracting cheat table structures: {str(e)}"
 
 @mcp.tool()
-def extract_cheat_table_lua_script(file_path: str) -> str:
+def extract_cheat_table_lua_script(file_path: str, max_chars: int = 0, size_only: bool = False) -> str:
     """Extract Lua script from a cheat table file
     
     Args:
         file_path: Full path to the .CT file to process
+        max_chars: Return at most this many characters (0 for the full output)
+        size_only: Report only the script's length and line count, not its text
         
     Returns:
         Lua script content
@@ -800,29 +858,36 @@ def extract_cheat_table_lua_script(file_path: str) -> str:
         logger.info(f"Extracting Lua script from cheat table: {file_path}")
         
         # Parse the cheat table
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list or not address_list.lua_script:
             return f"No Lua script found in cheat table: {file_path}"
         
+        script = address_list.lua_script
+        if size_only:
+            line_count = script.count('\n') + (0 if script.endswith('\n') else 1)
+            return (f"Lua Script from {os.path.basename(file_path)}: "
+                    f"{len(script)} characters, {line_count} lines")
+        
         result = f"Lua Script from {os.path.basename(file_path)}:\n"
         result += "=" * 60 + "\n\n"
-        result += address_list.lua_script
-        result += f"\n\n--- Script Length: {len(address_list.lua_script)} characters ---"
+        result += script
+        result += f"\n\n--- Script Length: {len(script)} characters ---"
         
-        return result
+        return limit_chars(result, max_chars)
         
     except Exception as e:
         logger.error(f"Error extracting Lua script: {e}")
         return f"Error extracting Lua script: {str(e)}"
 
 @mcp.tool()
-def extract_cheat_table_disassembler_comments(file_path: str, address_filter: str = "") -> str:
+def extract_cheat_table_disassembler_comments(file_path: str, address_filter: str = "", max_chars: int = 0) -> str:
     """Extract disassembler comments from a cheat table file
     
     Args:
         file_path: Full path to the .CT file to process
         address_filter: Optional address pattern to filter comments (e.g., "D2GAME.dll")
+        max_chars: Return at most this many characters (0 for the full output)
         
     Returns:
         Formatted disassembler comments
@@ -831,7 +896,7 @@ def extract_cheat_table_disassembler_comments(file_path: str, address_filter: st
         logger.info(f"Extracting disassembler comments from cheat table: {file_path}")
         
         # Parse the cheat table
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list or not address_list.disassembler_comments:
             return f"No disassembler comments found in cheat table: {file_path}"
@@ -857,18 +922,19 @@ def extract_cheat_table_disassembler_comments(file_path: str, address_filter: st
         if address_filter:
             result += f" (filtered from {len(address_list.disassembler_comments)} total)"
         
-        return result
+        return limit_chars(result, max_chars)
         
     except Exception as e:
         logger.error(f"Error extracting disassembler comments: {e}")
         return f"Error extracting disassembler comments: {str(e)}"
 
 @mcp.tool()
-def extract_unitplayer_structure(file_path: str) -> str:
+def extract_unitplayer_structure(file_path: str, max_lines: int = 0) -> str:
     """Extract the UnitPlayer structure definition from a cheat table
     
     Args:
         file_path: Full path to the .CT file to process
+        max_lines: Return at most this many lines (0 for the full output)
         
     Returns:
         Detailed UnitPlayer structure information
@@ -877,7 +943,7 @@ def extract_unitplayer_structure(file_path: str) -> str:
         logger.info(f"Extracting UnitPlayer structure from: {file_path}")
         
         # Parse the cheat table
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list or not address_list.structures:
             return f"No structures found in cheat table: {file_path}"
@@ -929,18 +995,19 @@ def extract_unitplayer_structure(file_path: str) -> str:
         if len(unitplayer.elements) > 10:
             result += f"... and {len(unitplayer.elements) - 10} more elements\n"
         
-        return result
+        return limit_lines(result, max_lines)
         
     except Exception as e:
         logger.error(f"Error extracting UnitPlayer structure: {e}")
         return f"Error extracting UnitPlayer structure: {str(e)}"
 
 @mcp.tool()
-def comprehensive_cheat_table_analysis(file_path: str) -> str:
+def comprehensive_cheat_table_analysis(file_path: str, max_lines: int = 0) -> str:
     """Perform comprehensive analysis of all cheat table components
     
     Args:
         file_path: Full path to the .CT file to process
+        max_lines: Return at most this many lines (0 for the full output)
         
     Returns:
         Complete analysis of addresses, structures, Lua script, and comments
@@ -949,7 +1016,7 @@ def comprehensive_cheat_table_analysis(file_path: str) -> str:
         logger.info(f"Performing comprehensive analysis of: {file_path}")
         
         # Parse the cheat table using compatibility method
-        address_list = cheat_table_parser.parse_file_to_addresslist(file_path)
+        address_list = load_cheat_table_addresslist(file_path)
         
         if not address_list:
             return f"Failed to parse cheat table: {file_path}"
@@ -1018,7 +1085,7 @@ def comprehensive_cheat_table_analysis(file_path: str) -> str:
         
         result += "Use specific extraction tools for detailed analysis of each component."
         
-        return result
+        return limit_lines(result, max_lines)
         
     except Exception as e:
         logger.error(f"Error performing comprehensive analysis: {e}")
@@ -5,11 +5,13 @@ Handles execution and termination of whitelisted applications
 
 import os
 import sys
+import asyncio
 import subprocess
 import logging
 import time
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterable
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
@@ -52,6 +54,13 @@ class ApplicationLauncher:
         self.launched_applications: Dict[int, LaunchedApplication] = {}
         self._session_file = None
         
+        # Secondary index: lowercase process name -> PIDs of launched applications
+        self._by_name: Dict[str, Set[int]] = defaultdict(set)
+        
+        # Status change notification for async waiters (created lazily on the waiter's loop)
+        self._status_changed: Optional[asyncio.Event] = None
+        self._status_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Common Windows application paths
         self.system_paths = [
             os.environ.get('WINDIR', 'C:\\Windows'),
@@ -70,6 +79,37 @@ class ApplicationLauncher:
         
         logger.info("Application launcher initialized")
     
+    def _track_application(self, app: LaunchedApplication):
+        """Add an application to tracking and the name index"""
+        self._untrack_application(app.pid)  # Replace any stale record for a reused PID
+        self.launched_applications[app.pid] = app
+        self._by_name[app.process_name.lower()].add(app.pid)
+    
+    def _untrack_application(self, pid: int):
+        """Remove an application from tracking and the name index"""
+        app = self.launched_applications.pop(pid, None)
+        if app is None:
+            return
+        name = app.process_name.lower()
+        pids = self._by_name.get(name)
+        if pids is not None:
+            pids.discard(pid)
+            if not pids:
+                del self._by_name[name]
+    
+    def register_application(self, app: LaunchedApplication):
+        """Start tracking an application that was launched outside the launcher
+        
+        Use this instead of writing to launched_applications directly, so the
+        name index and the session file stay consistent.
+        
+        Args:
+            app: Application record to track
+        """
+        self._track_application(app)
+        self._save_session()
+        self._notify_status_changed()
+    
     def set_session_file(self, session_file_path: str):
         """Set the session file for persistence"""
         self._session_file = session_file_path
@@ -98,7 +138,7 @@ class ApplicationLauncher:
                             working_directory=app_data['working_directory'],
                             status='running'
                         )
-                        self.launched_applications[pid] = app
+                        self._track_application(app)
                         logger.info(f"Restored session for PID {pid}: {app.process_name}")
                     else:
                         logger.info(f"Process {pid} ({app_data['process_name']}) no longer running")
@@ -330,8 +370,9 @@ class ApplicationLauncher:
                                         status='running'
                                     )
                                     
-                                    self.launched_applications[actual_pid] = app
+                                    self._track_application(app)
                                     self._save_session()
+                                    self._notify_status_changed()
                                     
                                     logger.info(f"Successfully launched {process_name} with elevated privileges (PID: {actual_pid})")
                                     return True, f"Successfully launched {process_name} with elevated privileges (PID: {actual_pid})", actual_pid
@@ -371,8 +412,9 @@ class ApplicationLauncher:
                     status='running'
                 )
                 
-                self.launched_applications[process.pid] = app
+                self._track_application(app)
                 self._save_session()
+                self._notify_status_changed()
                 
                 logger.info(f"Successfully launched {process_name} with PID {process.pid}")
                 return True, f"Successfully launched {process_name} (PID: {process.pid})", process.pid
@@ -397,8 +439,9 @@ class ApplicationLauncher:
                         status='running'
                     )
                     
-                    self.launched_applications[actual_pid] = app
+                    self._track_application(app)
                     self._save_session()
+                    self._notify_status_changed()
                     
                     logger.info(f"Successfully launched {process_name} with actual PID {actual_pid} (launcher PID {process.pid} exited)")
                     return True, f"Successfully launched {process_name} (PID: {actual_pid})", actual_pid
@@ -418,8 +461,9 @@ class ApplicationLauncher:
                         status='launched'  # Special status for launcher-spawned apps
                     )
                     
-                    self.launched_applications[process.pid] = app
+                    self._track_application(app)
                     self._save_session()
+                    self._notify_status_changed()
                     
                     return True, f"Successfully launched {process_name} via launcher (launcher PID: {process.pid})", process.pid
             else:
@@ -466,6 +510,7 @@ class ApplicationLauncher:
                 if pid in self.launched_applications:
                     self.launched_applications[pid].status = 'terminated'
                     self._save_session()
+                    self._notify_status_changed()
                 return True, f"Process {pid} was already terminated"
             
             logger.info(f"Terminating process {pid} ({process_name}), force={force}")
@@ -492,6 +537,7 @@ class ApplicationLauncher:
             if pid in self.launched_applications:
                 self.launched_applications[pid].status = 'terminated'
                 self._save_session()
+                self._notify_status_changed()
             
             logger.info(message)
             return True, message
@@ -500,6 +546,7 @@ class ApplicationLauncher:
             if pid in self.launched_applications:
                 self.launched_applications[pid].status = 'terminated'
                 self._save_session()
+                self._notify_status_changed()
             return True, f"Process {pid} was already terminated"
         except psutil.AccessDenied:
             return False, f"Access denied when trying to terminate process {pid}"
@@ -516,31 +563,64 @@ class ApplicationLauncher:
         """Get information about a specific launched application"""
         if pid in self.launched_applications:
             self._update_application_status()
-            return self.launched_applications[pid].to_dict()
+            # The refresh may have moved the application to a new PID
+            app = self.launched_applications.get(pid)
+            if app is not None:
+                return app.to_dict()
         return None
     
+    def get_applications_by_pids(self, pids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Get information about several launched applications with a single status refresh
+        
+        Args:
+            pids: Process IDs to look up
+            
+        Returns:
+            Dictionary mapping each tracked PID to its application info (untracked PIDs are omitted)
+        """
+        self._update_application_status()
+        return {pid: self.launched_applications[pid].to_dict()
+                for pid in pids if pid in self.launched_applications}
+    
+    def find_launched_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """Get launched applications whose process name contains the given text
+        
+        Args:
+            name: Case-insensitive text to look for in the process name
+            
+        Returns:
+            List of matching application records
+        """
+        self._update_application_status()
+        needle = name.lower()
+        return [self.launched_applications[pid].to_dict()
+                for process_name, pids in self._by_name.items() if needle in process_name
+                for pid in pids]
+    
     def _update_application_status(self):
         """Update the status of all tracked applications"""
         # Create a list of items to avoid dictionary modification during iteration
         items_to_update = list(self.launched_applications.items())
+        changed = False
         
         for pid, app in items_to_update:
             # Check if this PID is still in our dictionary (might have been moved)
             if pid not in self.launched_applications:
                 continue
                 
+            previous_status = app.status
             if app.status in ['running', 'launched']:
                 if not psutil.pid_exists(pid):
                     # For apps where the original PID no longer exists, try to find the actual process
                     # This handles both launcher-spawned apps and apps that immediately spawn new processes
                     actual_pid = self._find_running_process(app.process_name)
                     if actual_pid and actual_pid != pid:
-                        # Update to the actual running process
+                        # Move the entry to the actual running process
+                        self._untrack_application(pid)
                         app.pid = actual_pid
                         app.status = 'running'
-                        # Move the entry to the new PID
-                        del self.launched_applications[pid]
-                        self.launched_applications[actual_pid] = app
+                        self._track_application(app)
+                        changed = True
                         logger.info(f"Updated {app.process_name} from original PID {pid} to actual PID {actual_pid}")
                     else:
                         app.status = 'terminated'
@@ -556,6 +636,80 @@ class ApplicationLauncher:
                         app.status = 'terminated'
                     except Exception:
                         pass  # Keep current status if we can't determine
+            
+            if app.status != previous_status:
+                changed = True
+        
+        if changed:
+            self._notify_status_changed()
+    
+    def _notify_status_changed(self):
+        """Wake any coroutine blocked in wait_for_status()"""
+        event = self._status_changed
+        if event is None:
+            return
+        
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        if running_loop is self._status_loop:
+            event.set()
+        else:
+            # Called from a worker thread (e.g. via asyncio.to_thread)
+            try:
+                self._status_loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Waiter's loop has been closed
+    
+    async def wait_for_status(self, pid: int, status: str, timeout: float = 5.0,
+                              poll_interval: float = 0.25) -> bool:
+        """Wait until a launched application reaches the given status
+        
+        Wakes as soon as the launcher records a status change. Process exits that
+        happen outside the launcher are picked up by re-checking every poll_interval.
+        If a refresh moves the application to a new PID (e.g. calc.exe handing off
+        to the real Calculator process), the wait follows it.
+        
+        Args:
+            pid: Process ID of the launched application
+            status: Status to wait for (running, launched, terminated)
+            timeout: Maximum time to wait in seconds
+            poll_interval: Maximum time between status refreshes in seconds
+            
+        Returns:
+            True if the status was reached, False on timeout, unknown PID, or if
+            the application stops being tracked
+        """
+        app = self.launched_applications.get(pid)
+        if app is None:
+            return False
+        
+        loop = asyncio.get_running_loop()
+        if self._status_changed is None or self._status_loop is not loop:
+            self._status_changed = asyncio.Event()
+            self._status_loop = loop
+        event = self._status_changed
+        
+        deadline = loop.time() + timeout
+        while True:
+            event.clear()
+            # Check the application record itself, which keeps its identity across PID moves
+            self._update_application_status()
+            if app.status == status:
+                return True
+            if self.launched_applications.get(app.pid) is not app:
+                return False
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            
+            try:
+                await asyncio.wait_for(event.wait(), min(poll_interval, remaining))
+            except asyncio.TimeoutError:
+                pass
     
     def cleanup_terminated_applications(self) -> int:
         """Remove terminated applications from tracking
@@ -569,7 +723,7 @@ class ApplicationLauncher:
                          if app.status == 'terminated']
         
         for pid in terminated_pids:
-            del self.launched_applications[pid]
+            self._untrack_application(pid)
         
         if terminated_pids:
             self._save_session()
@@ -7,6 +7,8 @@ import ctypes
 import ctypes.wintypes
 import psutil
 import logging
+import sys
+import time
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
@@ -29,6 +31,29 @@ PAGE_EXECUTE_READ = 0x20
 PAGE_EXECUTE_READWRITE = 0x40
 PAGE_EXECUTE_WRITECOPY = 0x80
 
+# Toolhelp snapshot constants
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.wintypes.HANDLE(-1).value
+MAX_PATH = 260
+
+# How long a find_process_by_name result is reused, in seconds
+PROCESS_LOOKUP_TTL = 0.5
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """Toolhelp process entry (wide-character variant)"""
+    _fields_ = [
+        ("dwSize", ctypes.wintypes.DWORD),
+        ("cntUsage", ctypes.wintypes.DWORD),
+        ("th32ProcessID", ctypes.wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.wintypes.DWORD),
+        ("cntThreads", ctypes.wintypes.DWORD),
+        ("th32ParentProcessID", ctypes.wintypes.DWORD),
+        ("pcPriClassBase", ctypes.wintypes.LONG),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("szExeFile", ctypes.wintypes.WCHAR * MAX_PATH),
+    ]
+
 @dataclass
 class ProcessInfo:
     """Process information structure"""
@@ -46,6 +71,18 @@ class ProcessManager:
     def __init__(self):
         self.current_process: Optional[ProcessInfo] = None
         self.kernel32 = ctypes.windll.kernel32
+        self._setup_toolhelp_api()
+        # Lowercased executable name -> (timestamp, pid) of the last lookup
+        self._lookup_cache: Dict[str, tuple] = {}
+        
+    def _setup_toolhelp_api(self):
+        """Setup Toolhelp snapshot function signatures"""
+        self.kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+        self.kernel32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+        
+        for func in (self.kernel32.Process32FirstW, self.kernel32.Process32NextW):
+            func.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+            func.restype = ctypes.wintypes.BOOL
         
     def list_processes(self) -> List[Dict[str, Any]]:
         """Enumerate all running processes"""
@@ -62,6 +99,8 @@ class ProcessManager:
                         processes.append({
                             'pid': info['pid'],
                             'name': info['name'],
+                            # Lowercased once here so name lookups are plain comparisons
+                            'name_lc': sys.intern(info['name'].lower()),
                             'exe_path': info['exe'] or 'N/A',
                             'architecture': arch,
                             'memory_usage': info['memory_info'].rss if info['memory_info'] else 0
@@ -72,7 +111,41 @@ class ProcessManager:
         except Exception as e:
             logger.error(f"Error enumerating processes: {e}")
             
-        return sorted(processes, key=lambda x: x['name'].lower())
+        return sorted(processes, key=lambda x: x['name_lc'])
+    
+    def find_process_by_name(self, name: str) -> Optional[int]:
+        """Return the PID of the first process whose executable matches name
+        
+        Walks a Toolhelp snapshot and stops at the first match instead of
+        building the full process list. Results (including misses) are reused
+        for PROCESS_LOOKUP_TTL seconds so back-to-back checks share one walk.
+        """
+        target = name.casefold()
+        now = time.monotonic()
+        cached = self._lookup_cache.get(target)
+        if cached and now - cached[0] < PROCESS_LOOKUP_TTL:
+            return cached[1]
+        
+        pid = None
+        snapshot = self.kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+            logger.error(f"Failed to create process snapshot: {ctypes.get_last_error()}")
+            return None
+        
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            more = self.kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while more:
+                if entry.szExeFile.casefold() == target:
+                    pid = entry.th32ProcessID
+                    break
+                more = self.kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            self.kernel32.CloseHandle(snapshot)
+        
+        self._lookup_cache[target] = (now, pid)
+        return pid
     
     def _get_process_architecture(self, pid: int) -> str:
         """Determine process architecture (32-bit or 64-bit)"""
@@ -127,7 +200,8 @@ class ProcessManager:
         else:
             # Attach by name
             processes = self.list_processes()
-            matches = [p for p in processes if p['name'].lower() == identifier.lower()]
+            identifier_lc = identifier.lower()
+            matches = [p for p in processes if p['name_lc'] == identifier_lc]
             
             if not matches:
                 raise Exception(f"Process '{identifier}' not found")
@@ -10,7 +10,8 @@ from .validators import (
 )
 from .formatters import (
     format_memory_data, format_raw_bytes, format_process_info,
-    format_size, format_timestamp, format_hex_dump, format_scan_results
+    format_size, format_timestamp, format_hex_dump, format_scan_results,
+    limit_lines, limit_chars
 )
 from .data_types import (
     DataType, Architecture, MemoryProtection,
@@ -28,6 +29,7 @@ __all__ = [
     # Formatters
     'format_memory_data', 'format_raw_bytes', 'format_process_info',
     'format_size', 'format_timestamp', 'format_hex_dump', 'format_scan_results',
+    'limit_lines', 'limit_chars',
     
     # Data Types
     'DataType', 'Architecture', 'MemoryProtection',
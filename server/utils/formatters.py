@@ -428,3 +428,28 @@ def format_scan_results(results: List[int], pattern: str, limit: int = 50) -> st
         output.append(f"... and {len(results) - limit} more matches")
     
     return '\n'.join(output)
+
+def limit_lines(text: str, max_lines: int) -> str:
+    """Truncate text to its first max_lines lines (0 or less means no limit)"""
+    if max_lines <= 0:
+        return text
+    
+    # Find the end of the last kept line without splitting the whole text
+    end = -1
+    for _ in range(max_lines):
+        end = text.find('\n', end + 1)
+        if end < 0:
+            return text
+    
+    if end + 1 == len(text):
+        return text
+    
+    remaining = text.count('\n', end + 1) + (0 if text.endswith('\n') else 1)
+    return f"{text[:end]}\n... ({remaining} more lines truncated)"
+
+def limit_chars(text: str, max_chars: int) -> str:
+    """Truncate text to its first max_chars characters (0 or less means no limit)"""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    
+    return f"{text[:max_chars]}... ({len(text) - max_chars} more characters truncated)"
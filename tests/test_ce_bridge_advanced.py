@@ -579,6 +579,34 @@ class TestMemoryUtilities(unittest.TestCase):
             self.bridge._memory_type_to_string(0x1000000), 
             "MEM_IMAGE"
         )
+        
+    def test_search_pattern_in_data(self):
+        """Test byte pattern search honours overlaps and alignment"""
+        pattern = "AB".encode('utf-16le')
+        data = b"\x00" + pattern + pattern + b"\x00\x00" + pattern
+        base = 0x1000
+        
+        # Every occurrence is reported when unaligned
+        self.assertEqual(
+            self.bridge._search_pattern_in_data(data, pattern, base, 1),
+            [base + 1, base + 5, base + 11]
+        )
+        
+        # Odd offsets are skipped with 2-byte alignment
+        self.assertEqual(
+            self.bridge._search_pattern_in_data(data, pattern, base, 2),
+            []
+        )
+        self.assertEqual(
+            self.bridge._search_pattern_in_data(b"\x00" + data, pattern, base, 2),
+            [base + 2, base + 6, base + 12]
+        )
+        
+        # Overlapping matches are all found
+        self.assertEqual(
+            self.bridge._search_pattern_in_data(b"aaaa", b"aa", 0, 1),
+            [0, 1, 2]
+        )
 
 
 class TestDataTypes(unittest.TestCase):
@@ -0,0 +1,66 @@
+"""
+Unit Tests for Output Limiting Helpers
+
+Tests limit_lines and limit_chars, which truncate tool output before it
+is returned to the client.
+"""
+
+import unittest
+import os
+
+# Import the module under test
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from utils.formatters import limit_lines, limit_chars
+
+
+class TestLimitLines(unittest.TestCase):
+    """Test line-based truncation"""
+
+    def test_exactly_max_lines(self):
+        """Text with exactly max_lines lines is returned unchanged"""
+        self.assertEqual(limit_lines("a\nb\nc", 3), "a\nb\nc")
+
+    def test_exactly_max_lines_with_trailing_newline(self):
+        """A trailing newline does not count as an extra line"""
+        self.assertEqual(limit_lines("a\nb\n", 2), "a\nb\n")
+
+    def test_truncates_extra_lines(self):
+        """Lines past max_lines are replaced by a summary"""
+        self.assertEqual(limit_lines("a\nb\nc\nd", 2), "a\nb\n... (2 more lines truncated)")
+
+    def test_truncates_with_trailing_newline(self):
+        """The truncated count ignores a trailing newline"""
+        self.assertEqual(limit_lines("a\nb\nc\n", 2), "a\nb\n... (1 more lines truncated)")
+
+    def test_non_positive_max_lines_means_no_limit(self):
+        """max_lines of 0 or less returns the text unchanged"""
+        text = "a\nb\nc"
+        self.assertEqual(limit_lines(text, 0), text)
+        self.assertEqual(limit_lines(text, -1), text)
+
+    def test_empty_text(self):
+        """Empty text is returned unchanged"""
+        self.assertEqual(limit_lines("", 5), "")
+
+
+class TestLimitChars(unittest.TestCase):
+    """Test character-based truncation"""
+
+    def test_exactly_max_chars(self):
+        """Text of exactly max_chars characters is returned unchanged"""
+        self.assertEqual(limit_chars("abcde", 5), "abcde")
+
+    def test_one_over_max_chars(self):
+        """Text one character over the limit is truncated"""
+        self.assertEqual(limit_chars("abcdef", 5), "abcde... (1 more characters truncated)")
+
+    def test_non_positive_max_chars_means_no_limit(self):
+        """max_chars of 0 or less returns the text unchanged"""
+        self.assertEqual(limit_chars("abcdef", 0), "abcdef")
+        self.assertEqual(limit_chars("abcdef", -1), "abcdef")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit Tests for Application Launcher Status Tracking
+
+Tests status lookups and waits when a launched application hands off
+to a new process (e.g. calc.exe starting the real Calculator process).
+"""
+
+import unittest
+import asyncio
+import os
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+# Import the module under test
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from process.launcher import ApplicationLauncher, LaunchedApplication
+
+
+OLD_PID = 1000
+NEW_PID = 2000
+
+
+class TestLauncherPidMigration(unittest.TestCase):
+    """Test lookups and waits across a PID migration"""
+
+    def setUp(self):
+        """Set up a launcher tracking one calc.exe launch"""
+        self.launcher = ApplicationLauncher(Mock())
+        self.app = LaunchedApplication(
+            process_name='calc.exe',
+            pid=OLD_PID,
+            exe_path='C:\\Windows\\System32\\calc.exe',
+            launch_time=datetime.now(),
+            command_line=['calc.exe'],
+            working_directory='C:\\Windows\\System32',
+            status='launched'
+        )
+        self.launcher._track_application(self.app)
+
+        # The launcher process has exited and the real process runs under a new PID
+        patch('process.launcher.psutil.pid_exists', side_effect=lambda pid: pid == NEW_PID).start()
+        patch('process.launcher.psutil.Process').start().return_value.status.return_value = 'running'
+        self.launcher._find_running_process = Mock(return_value=NEW_PID)
+        self.addCleanup(patch.stopall)
+
+    def test_get_application_by_pid_after_migration(self):
+        """Looking up the old PID returns None once the refresh moves the app"""
+        self.assertIsNone(self.launcher.get_application_by_pid(OLD_PID))
+
+        app_info = self.launcher.get_application_by_pid(NEW_PID)
+        self.assertEqual(app_info['pid'], NEW_PID)
+        self.assertEqual(app_info['status'], 'running')
+
+    def test_wait_for_status_follows_migration(self):
+        """Waiting on the old PID follows the app to its new PID"""
+        reached = asyncio.run(self.launcher.wait_for_status(OLD_PID, 'running', timeout=1.0))
+
+        self.assertTrue(reached)
+        self.assertNotIn(OLD_PID, self.launcher.launched_applications)
+        self.assertIs(self.launcher.launched_applications[NEW_PID], self.app)
+        self.assertEqual([a['pid'] for a in self.launcher.find_launched_by_name('calc')], [NEW_PID])
+
+    def test_wait_for_status_untracked_app(self):
+        """Waiting stops (without raising) once the app is no longer tracked"""
+        self.launcher._find_running_process = Mock(return_value=None)
+
+        async def wait_and_untrack():
+            waiter = asyncio.ensure_future(
+                self.launcher.wait_for_status(OLD_PID, 'running', timeout=1.0, poll_interval=0.01)
+            )
+            await asyncio.sleep(0.02)
+            self.launcher._untrack_application(OLD_PID)
+            return await waiter
+
+        self.assertFalse(asyncio.run(wait_and_untrack()))
+
+    def test_register_application_updates_name_index(self):
+        """Applications registered from outside are found by name"""
+        app = LaunchedApplication(
+            process_name='notepad.exe',
+            pid=3000,
+            exe_path='C:\\Windows\\notepad.exe',
+            launch_time=datetime.now(),
+            command_line=['notepad.exe'],
+            working_directory='C:\\Windows'
+        )
+        self.launcher.register_application(app)
+
+        self.assertIs(self.launcher.launched_applications[3000], app)
+        self.assertEqual(self.launcher._by_name['notepad.exe'], {3000})
+
+    def test_wait_for_status_unknown_pid(self):
+        """Waiting on a PID that was never tracked returns False immediately"""
+        self.assertFalse(asyncio.run(self.launcher.wait_for_status(12345, 'running', timeout=1.0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
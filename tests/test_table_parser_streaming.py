@@ -0,0 +1,116 @@
+"""
+Unit Tests for Streaming Cheat Table Parsing
+
+Tests that CheatTableParser.iter_entries() yields the same entries, in the
+same order, as parse_file(), with both the lxml and ElementTree backends.
+"""
+
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+
+# Import the module under test
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
+
+from cheatengine import table_parser
+from cheatengine.table_parser import CheatTableParser, CheatTable, CheatEntry
+
+
+NESTED_TABLE = """<?xml version="1.0" encoding="utf-8"?>
+<CheatTable CheatEngineTableVersion="45">
+  <CheatEntries>
+    <CheatEntry>
+      <ID>1</ID>
+      <Description>"Player"</Description>
+      <GroupHeader>1</GroupHeader>
+      <CheatEntries>
+        <CheatEntry>
+          <ID>2</ID>
+          <Description>"Health"</Description>
+          <VariableType>4 Bytes</VariableType>
+          <Address>game.exe+1000</Address>
+        </CheatEntry>
+        <CheatEntry>
+          <ID>3</ID>
+          <Description>"Inventory"</Description>
+          <CheatEntries>
+            <CheatEntry>
+              <ID>4</ID>
+              <Description>"Gold"</Description>
+              <VariableType>4 Bytes</VariableType>
+              <Address>00401000</Address>
+              <Offsets>
+                <Offset>10</Offset>
+                <Offset>4</Offset>
+              </Offsets>
+            </CheatEntry>
+          </CheatEntries>
+        </CheatEntry>
+      </CheatEntries>
+    </CheatEntry>
+    <CheatEntry>
+      <ID>5</ID>
+      <Description>"Level"</Description>
+      <VariableType>Byte</VariableType>
+      <Address>00402000</Address>
+    </CheatEntry>
+  </CheatEntries>
+</CheatTable>
+"""
+
+
+def _entry_fields(entry: CheatEntry):
+    """Fields compared between the streaming and full parsers"""
+    return (entry.id, entry.description, entry.address, entry.variable_type, entry.offsets)
+
+
+class TestIterEntries(unittest.TestCase):
+    """Test streaming entry iteration against full parsing"""
+
+    def setUp(self):
+        """Write the nested test table to a temporary file"""
+        self.parser = CheatTableParser()
+        fd, self.table_path = tempfile.mkstemp(suffix='.CT')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(NESTED_TABLE)
+        self.addCleanup(os.remove, self.table_path)
+
+    def _assert_matches_parse_file(self):
+        expected = [_entry_fields(e) for e in self.parser.parse_file(self.table_path).entries]
+        streamed = [_entry_fields(e) for e in self.parser.iter_entries(self.table_path)]
+
+        self.assertEqual([fields[0] for fields in expected], ['1', '2', '3', '4', '5'])
+        self.assertEqual(streamed, expected)
+
+    @unittest.skipUnless(table_parser.LXML_AVAILABLE, "lxml not installed")
+    def test_iter_entries_matches_parse_file_lxml(self):
+        """Nested entries stream in parse_file() order with lxml"""
+        self._assert_matches_parse_file()
+
+    def test_iter_entries_matches_parse_file_elementtree(self):
+        """Nested entries stream in parse_file() order with ElementTree"""
+        with patch.object(table_parser, 'LXML_AVAILABLE', False):
+            self._assert_matches_parse_file()
+
+    def test_iter_entries_binary_table(self):
+        """Binary-format tables fall back to the full binary parser"""
+        with open(self.table_path, 'wb') as f:
+            f.write(b'\x00\x01CE binary table')
+
+        entries = [CheatEntry(id='1', description='Health'), CheatEntry(id='2', description='Gold')]
+        with patch.object(CheatTableParser, '_parse_binary_format_to_cheattable',
+                          return_value=CheatTable(entries=entries)) as binary_parser:
+            streamed = list(self.parser.iter_entries(self.table_path))
+
+        binary_parser.assert_called_once()
+        self.assertEqual(streamed, entries)
+
+    def test_iter_entries_missing_file(self):
+        """A missing file yields nothing"""
+        self.assertEqual(list(self.parser.iter_entries(self.table_path + '.missing')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()